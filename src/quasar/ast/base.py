@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from quasar.ast.span import Span
 
 
-@dataclass
+@dataclass(slots=True)
 class Node(ABC):
     """
     Abstract base class for all AST nodes.
@@ -27,7 +27,7 @@ class Node(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression(Node, ABC):
     """
     Abstract base class for all expression nodes.
@@ -38,7 +38,7 @@ class Expression(Node, ABC):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement(Node, ABC):
     """
     Abstract base class for all statement nodes.
@@ -49,7 +49,7 @@ class Statement(Node, ABC):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Declaration(Node, ABC):
     """
     Abstract base class for all declaration nodes.
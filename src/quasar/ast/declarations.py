@@ -16,7 +16,7 @@ from quasar.ast.statements import Block
 from quasar.ast.types import TypeAnnotation
 
 
-@dataclass
+@dataclass(slots=True)
 class Param:
     """
     Function parameter.
@@ -44,7 +44,7 @@ class Param:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VarDecl(Declaration):
     """
     Variable declaration: let name: type = initializer.
@@ -75,7 +75,7 @@ class VarDecl(Declaration):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstDecl(Declaration):
     """
     Constant declaration: const name: type = initializer.
@@ -106,7 +106,7 @@ class ConstDecl(Declaration):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FnDecl(Declaration):
     """
     Function declaration: fn name(params) -> return_type { body }.
@@ -141,7 +141,7 @@ class FnDecl(Declaration):
             f"span={self.span!r})"
         )
 
-@dataclass
+@dataclass(slots=True)
 class StructField:
     """
     Field Definition in a Struct.
@@ -167,7 +167,7 @@ class StructField:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StructDecl(Declaration):
     """
     Struct Declaration: struct Name { fields }
@@ -196,7 +196,7 @@ class StructDecl(Declaration):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportDecl(Declaration):
     """
     Import declaration (Phase 9).
@@ -228,7 +228,7 @@ class ImportDecl(Declaration):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumVariant:
     """
     A single variant in an enum declaration.
@@ -262,7 +262,7 @@ class EnumVariant:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumDecl(Declaration):
     """
     Enum declaration: enum Name { Variant1, Variant2, ... }
@@ -21,7 +21,7 @@ from quasar.ast.operators import BinaryOp, UnaryOp
 from quasar.ast.span import Span
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpr(Expression):
     """
     Binary expression: left operator right.
@@ -54,7 +54,7 @@ class BinaryExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryExpr(Expression):
     """
     Unary expression: operator operand.
@@ -83,7 +83,7 @@ class UnaryExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallExpr(Expression):
     """
     Function call expression: callee(arguments).
@@ -113,7 +113,7 @@ class CallExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(Expression):
     """
     Identifier expression: a reference to a variable or constant.
@@ -140,7 +140,7 @@ class Identifier(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IntLiteral(Expression):
     """
     Integer literal expression.
@@ -167,7 +167,7 @@ class IntLiteral(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatLiteral(Expression):
     """
     Float literal expression.
@@ -194,7 +194,7 @@ class FloatLiteral(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expression):
     """
     String literal expression.
@@ -221,7 +221,7 @@ class StringLiteral(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoolLiteral(Expression):
     """
     Boolean literal expression.
@@ -247,7 +247,7 @@ class BoolLiteral(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ListLiteral(Expression):
     """
     List literal expression (Phase 6.0).
@@ -275,7 +275,7 @@ class ListLiteral(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexExpr(Expression):
     """
     Index access expression (Phase 6.1).
@@ -305,7 +305,7 @@ class IndexExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeExpr(Expression):
     """
     Range expression (Phase 6.3).
@@ -337,7 +337,7 @@ class RangeExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldInit:
     """
     Field initialization in a struct instantiation.
@@ -363,7 +363,7 @@ class FieldInit:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StructInitExpr(Expression):
     """
     Struct instantiation expression (Phase 8.1).
@@ -390,7 +390,7 @@ class StructInitExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MemberAccessExpr(Expression):
     """
     Member access expression (Phase 8.2).
@@ -418,7 +418,7 @@ class MemberAccessExpr(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DictEntry(Expression):
     """
     A single key-value pair in a dictionary literal (Phase 10.0).
@@ -445,7 +445,7 @@ class DictEntry(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DictLiteral(Expression):
     """
     Dictionary literal expression (Phase 10.0).
@@ -470,7 +470,7 @@ class DictLiteral(Expression):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodCallExpr(Expression):
     """
     Method call expression on primitive types (Phase 11.0).
@@ -51,6 +51,11 @@ class BinaryOp(Enum):
     AND = auto()
     OR = auto()
     
+    # CodeGenerator looks every BinaryExpr operator up in _BINARY_OP_TO_PYTHON
+    # (and _BINARY_OP_EVAL when folding). Members compare by identity, so an
+    # identity hash is consistent and avoids Enum's hash(self._name_).
+    __hash__ = object.__hash__
+    
     def __repr__(self) -> str:
         """Deterministic representation for snapshots."""
         return f"BinaryOp.{self.name}"
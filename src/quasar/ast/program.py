@@ -10,7 +10,7 @@ from quasar.ast.base import Declaration, Node
 from quasar.ast.span import Span
 
 
-@dataclass
+@dataclass(slots=True)
 class Program(Node):
     """
     Program: the root node of a Quasar AST.
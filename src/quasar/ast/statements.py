@@ -19,7 +19,7 @@ from quasar.ast.base import Declaration, Expression, Statement
 from quasar.ast.span import Span
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(Statement):
     """
     Block statement: a sequence of declarations enclosed in braces.
@@ -45,7 +45,7 @@ class Block(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStmt(Statement):
     """
     Expression statement: an expression used as a statement.
@@ -71,7 +71,7 @@ class ExpressionStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Statement):
     """
     If statement: conditional execution.
@@ -103,7 +103,7 @@ class IfStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Statement):
     """
     While statement: loop execution.
@@ -132,7 +132,7 @@ class WhileStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Statement):
     """
     Return statement: return a value from a function.
@@ -160,7 +160,7 @@ class ReturnStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakStmt(Statement):
     """
     Break statement: exit the innermost loop.
@@ -181,7 +181,7 @@ class BreakStmt(Statement):
         return f"BreakStmt(span={self.span!r})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStmt(Statement):
     """
     Continue statement: skip to next iteration of innermost loop.
@@ -202,7 +202,7 @@ class ContinueStmt(Statement):
         return f"ContinueStmt(span={self.span!r})"
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignStmt(Statement):
     """
     Assignment statement: assign a value to a variable.
@@ -233,7 +233,7 @@ class AssignStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintStmt(Statement):
     """
     Print statement: output values to console (Phase 5 + 5.1).
@@ -273,7 +273,7 @@ class PrintStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexAssignStmt(Statement):
     """
     Index assignment statement (Phase 6.1): assign to a list element.
@@ -305,7 +305,7 @@ class IndexAssignStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStmt(Statement):
     """
     For loop statement (Phase 6.3): iterate over a range or list.
@@ -343,7 +343,7 @@ class ForStmt(Statement):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MemberAssignStmt(Statement):
     """
     Member assignment statement (Phase 8.2): assign to a struct field.
@@ -17,7 +17,7 @@ from typing import Union
 # Type Classes
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrimitiveType:
     """
     Represents a primitive type in Quasar.
@@ -33,7 +33,7 @@ class PrimitiveType:
         return f"PrimitiveType({self.name!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListType:
     """
     Represents a list type in Quasar: [T]
@@ -51,7 +51,7 @@ class ListType:
         return f"ListType({self.element_type!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DictType:
     """
     Represents a dictionary type in Quasar: Dict[K, V]
@@ -73,7 +73,7 @@ class DictType:
         return f"DictType({self.key_type!r}, {self.value_type!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnumType:
     """
     Represents an enum type in Quasar.
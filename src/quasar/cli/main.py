@@ -11,7 +11,6 @@ Usage:
 """
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
@@ -58,6 +57,16 @@ def create_parser() -> argparse.ArgumentParser:
         default=None,
         help="Output file path (default: <input>.py)",
     )
+    compile_parser.add_argument(
+        "--legacy-format",
+        action="store_true",
+        help="Emit str.format() instead of f-strings for formatted print (deprecated)",
+    )
+    compile_parser.add_argument(
+        "--fold-constants",
+        action="store_true",
+        help="Replace literal-only arithmetic/logic with its value, e.g. (2 + 3) * 4 -> 20",
+    )
     
     # run command
     run_parser = subparsers.add_parser(
@@ -69,6 +78,16 @@ def create_parser() -> argparse.ArgumentParser:
         type=str,
         help="Quasar source file (.qsr)",
     )
+    run_parser.add_argument(
+        "--legacy-format",
+        action="store_true",
+        help="Emit str.format() instead of f-strings for formatted print (deprecated)",
+    )
+    run_parser.add_argument(
+        "--fold-constants",
+        action="store_true",
+        help="Replace literal-only arithmetic/logic with its value, e.g. (2 + 3) * 4 -> 20",
+    )
     
     # check command
     check_parser = subparsers.add_parser(
@@ -113,13 +132,22 @@ def read_source(filepath: str) -> str:
         sys.exit(EXIT_ERROR)
 
 
-def compile_source(source: str, filename: str = "<stdin>") -> str:
+def compile_source(
+    source: str,
+    filename: str = "<stdin>",
+    legacy_format: bool = False,
+    fold_constants: bool = False,
+) -> str:
     """
     Compile Quasar source to Python.
     
     Args:
         source: Quasar source code.
         filename: Source filename for error messages.
+        legacy_format: Emit str.format() instead of f-strings for
+            formatted print (deprecated).
+        fold_constants: Emit the value of literal-only expressions instead
+            of the expression itself.
         
     Returns:
         Generated Python code.
@@ -150,7 +178,7 @@ def compile_source(source: str, filename: str = "<stdin>") -> str:
         analyzer.analyze(ast)
         
         # Code generation
-        generator = CodeGenerator()
+        generator = CodeGenerator(legacy_format=legacy_format, fold_constants=fold_constants)
         return generator.generate(ast)
         
     except LexerError as e:
@@ -213,7 +241,7 @@ def cmd_compile(args: argparse.Namespace) -> int:
     Compiles a Quasar file to Python and writes the output.
     """
     source = read_source(args.file)
-    python_code = compile_source(source, args.file)
+    python_code = compile_source(source, args.file, args.legacy_format, args.fold_constants)
     
     # Determine output path
     if args.output:
@@ -234,10 +262,11 @@ def cmd_run(args: argparse.Namespace) -> int:
     """
     Handle the 'run' command.
     
-    Compiles a Quasar file and executes the generated Python code.
+    Compiles a Quasar file and executes the generated Python code
+    in the current interpreter (no child process is spawned).
     """
     source = read_source(args.file)
-    python_code = compile_source(source, args.file)
+    python_code = compile_source(source, args.file, args.legacy_format, args.fold_constants)
     
     # Execute the generated code
     try:
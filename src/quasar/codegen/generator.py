@@ -4,6 +4,9 @@ Code generator for Quasar.
 Transpiles Quasar AST to Python source code.
 """
 
+import math
+import operator
+import warnings
 from typing import List
 
 from quasar.ast import (
@@ -55,6 +58,78 @@ from quasar.ast import (
 )
 
 
+# Quasar binary operator -> Python operator
+_BINARY_OP_TO_PYTHON = {
+    # Arithmetic
+    BinaryOp.ADD: "+",
+    BinaryOp.SUB: "-",
+    BinaryOp.MUL: "*",
+    BinaryOp.DIV: "/",
+    BinaryOp.MOD: "%",
+    # Comparison
+    BinaryOp.EQ: "==",
+    BinaryOp.NE: "!=",
+    BinaryOp.LT: "<",
+    BinaryOp.GT: ">",
+    BinaryOp.LE: "<=",
+    BinaryOp.GE: ">=",
+    # Logical (Quasar && || → Python and or)
+    BinaryOp.AND: "and",
+    BinaryOp.OR: "or",
+}
+
+
+# Quasar binary operator -> Python evaluation, matching _BINARY_OP_TO_PYTHON
+_BINARY_OP_EVAL = {
+    BinaryOp.ADD: operator.add,
+    BinaryOp.SUB: operator.sub,
+    BinaryOp.MUL: operator.mul,
+    BinaryOp.DIV: operator.truediv,
+    BinaryOp.MOD: operator.mod,
+    BinaryOp.EQ: operator.eq,
+    BinaryOp.NE: operator.ne,
+    BinaryOp.LT: operator.lt,
+    BinaryOp.GT: operator.gt,
+    BinaryOp.LE: operator.le,
+    BinaryOp.GE: operator.ge,
+    BinaryOp.AND: lambda a, b: a and b,
+    BinaryOp.OR: lambda a, b: a or b,
+}
+
+
+def _fold_unary(operator: UnaryOp, operand: int | float | bool) -> int | float | bool:
+    """Apply a unary operator to a constant operand."""
+    return -operand if operator == UnaryOp.NEG else not operand
+
+
+def _fold_binary(
+    operator: BinaryOp, left: int | float | bool, right: int | float | bool
+) -> int | float | bool | None:
+    """
+    Apply a binary operator to constant operands.
+    
+    Evaluation uses the same Python operators the generated code would, so
+    a folded literal prints exactly what the unfolded expression computes.
+    
+    Returns:
+        The value, or None if evaluating it would raise (e.g. division by
+        zero) or give inf/nan.
+    """
+    try:
+        value = _BINARY_OP_EVAL[operator](left, right)
+    except ArithmeticError:
+        return None
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+# Characters that rule out inlining a generated argument into an f-string
+# replacement field: the enclosing quote and backslashes are rejected there
+# before Python 3.12, braces would nest fields, and ':' starts a format spec.
+_FSTRING_UNSAFE_CHARS = ('"', "\\", "{", "}", ":")
+
+
 class CodeGenerator:
     """
     Generates Python source code from a Quasar AST.
@@ -68,8 +143,29 @@ class CodeGenerator:
     # Indentation unit (4 spaces)
     INDENT = "    "
     
-    def __init__(self) -> None:
-        """Initialize the code generator."""
+    def __init__(self, legacy_format: bool = False, fold_constants: bool = False) -> None:
+        """
+        Initialize the code generator.
+        
+        Args:
+            legacy_format: Emit "template".format(...) for print format
+                mode instead of f-strings (deprecated).
+            fold_constants: Emit the value of unary/binary expressions whose
+                operands are all int, float or bool literals, e.g.
+                (2 + 3) * 4 -> 20.
+        """
+        if legacy_format:
+            warnings.warn(
+                "legacy_format is deprecated and will be removed in the next release",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        self._legacy_format = legacy_format
+        self._fold_constants = fold_constants
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear emitted output and indentation (generate() does this itself)."""
         self._indent_level = 0
         self._lines: List[str] = []
     
@@ -181,8 +277,7 @@ class CodeGenerator:
         Returns:
             Python source code as a string.
         """
-        self._indent_level = 0
-        self._lines = []
+        self.reset()
         
         # Add imports if necessary
         imports_needed = []
@@ -238,42 +333,9 @@ class CodeGenerator:
     
     def _generate_declaration(self, decl) -> None:
         """Dispatch declaration generation based on type."""
-        if isinstance(decl, VarDecl):
-            self._generate_var_decl(decl)
-        elif isinstance(decl, ConstDecl):
-            self._generate_const_decl(decl)
-        elif isinstance(decl, FnDecl):
-            self._generate_fn_decl(decl)
-        elif isinstance(decl, StructDecl):
-            self._generate_struct_decl(decl)
-        elif isinstance(decl, EnumDecl):
-            self._generate_enum_decl(decl)
-        elif isinstance(decl, ImportDecl):
-            self._generate_import_decl(decl)
-        elif isinstance(decl, ExpressionStmt):
-            self._generate_expression_stmt(decl)
-        elif isinstance(decl, IfStmt):
-            self._generate_if_stmt(decl)
-        elif isinstance(decl, WhileStmt):
-            self._generate_while_stmt(decl)
-        elif isinstance(decl, ForStmt):
-            self._generate_for_stmt(decl)
-        elif isinstance(decl, ReturnStmt):
-            self._generate_return_stmt(decl)
-        elif isinstance(decl, BreakStmt):
-            self._generate_break_stmt(decl)
-        elif isinstance(decl, ContinueStmt):
-            self._generate_continue_stmt(decl)
-        elif isinstance(decl, PrintStmt):
-            self._generate_print_stmt(decl)
-        elif isinstance(decl, AssignStmt):
-            self._generate_assign_stmt(decl)
-        elif isinstance(decl, IndexAssignStmt):
-            self._generate_index_assign_stmt(decl)
-        elif isinstance(decl, MemberAssignStmt):
-            self._generate_member_assign_stmt(decl)
-        elif isinstance(decl, Block):
-            self._generate_block(decl)
+        handler = self._DECLARATION_HANDLERS.get(type(decl))
+        if handler is not None:
+            handler(self, decl)
     
     def _generate_var_decl(self, decl: VarDecl) -> None:
         """Generate: name = expr"""
@@ -363,7 +425,9 @@ class CodeGenerator:
         
         Phase 5.2: Format mode detection
         If args[0] is StringLiteral AND contains {} (not escaped) AND len(args) > 1:
-            Generate: print("template".format(arg1, arg2, ...), end=end_val)
+            Generate: print(f"template", end=end_val) with each {} replaced
+            by its argument, or print("template".format(arg1, ...), end=end_val)
+            when the arguments cannot be inlined (see _format_as_fstring)
         Else:
             Generate: print(arg0, arg1, ..., sep=sep_val, end=end_val)
         """
@@ -380,7 +444,11 @@ class CodeGenerator:
             # Format mode: print("template".format(args...), end=...)
             template = self._generate_expression(stmt.arguments[0])
             format_args = [self._generate_expression(arg) for arg in stmt.arguments[1:]]
-            format_call = f"{template}.format({', '.join(format_args)})"
+            format_call = None
+            if not self._legacy_format:
+                format_call = self._format_as_fstring(format_str, format_args)
+            if format_call is None:
+                format_call = f"{template}.format({', '.join(format_args)})"
             
             # Build print call (sep is ignored in format mode)
             if stmt.end is not None:
@@ -405,6 +473,43 @@ class CodeGenerator:
             
             self._emit(f"print({parts})")
     
+    def _format_as_fstring(self, template: str, args: List[str]) -> str | None:
+        """
+        Build f"..." from a print format template and generated arguments.
+        
+        Returns None when the call must stay as .format(): the number of {}
+        placeholders differs from the number of arguments (.format ignores
+        extras but still evaluates them), the template has other brace
+        fields, or an argument contains characters that an f-string
+        replacement field cannot hold on Python 3.10.
+        """
+        if any(ch in arg for arg in args for ch in _FSTRING_UNSAFE_CHARS):
+            return None
+        
+        parts = []
+        used = 0
+        i = 0
+        while i < len(template):
+            pair = template[i:i + 2]
+            if pair in ("{{", "}}"):
+                parts.append(pair)
+                i += 2
+            elif pair == "{}":
+                if used == len(args):
+                    return None
+                parts.append(f"{{{args[used]}}}")
+                used += 1
+                i += 2
+            elif template[i] in "{}":
+                return None
+            else:
+                parts.append(template[i])
+                i += 1
+        
+        if used != len(args):
+            return None
+        return f'f"{"".join(parts)}"'
+    
     def _generate_assign_stmt(self, stmt: AssignStmt) -> None:
         """Generate: target = expr"""
         expr = self._generate_expression(stmt.value)
@@ -422,38 +527,26 @@ class CodeGenerator:
     
     def _generate_expression(self, expr) -> str:
         """Generate expression and return as string."""
-        if isinstance(expr, IntLiteral):
-            return str(expr.value)
-        elif isinstance(expr, FloatLiteral):
-            return str(expr.value)
-        elif isinstance(expr, StringLiteral):
-            return f'"{expr.value}"'
-        elif isinstance(expr, BoolLiteral):
-            return "True" if expr.value else "False"
-        elif isinstance(expr, Identifier):
-            return expr.name
-        elif isinstance(expr, BinaryExpr):
-            return self._generate_binary_expr(expr)
-        elif isinstance(expr, UnaryExpr):
-            return self._generate_unary_expr(expr)
-        elif isinstance(expr, CallExpr):
-            return self._generate_call_expr(expr)
-        elif isinstance(expr, ListLiteral):
-            return self._generate_list_literal(expr)
-        elif isinstance(expr, IndexExpr):
-            return self._generate_index_expr(expr)
-        elif isinstance(expr, RangeExpr):
-            return self._generate_range_expr(expr)
-        elif isinstance(expr, StructInitExpr):
-            return self._generate_struct_init_expr(expr)
-        elif isinstance(expr, MemberAccessExpr):
-            return self._generate_member_access_expr(expr)
-        elif isinstance(expr, DictLiteral):
-            return self._generate_dict_literal(expr)
-        elif isinstance(expr, MethodCallExpr):
-            return self._generate_method_call_expr(expr)
-        else:
+        handler = self._EXPRESSION_HANDLERS.get(type(expr))
+        if handler is None:
             return ""
+        return handler(self, expr)
+    
+    def _generate_number_literal(self, expr: IntLiteral | FloatLiteral) -> str:
+        """Generate int or float literal."""
+        return str(expr.value)
+    
+    def _generate_string_literal(self, expr: StringLiteral) -> str:
+        """Generate string literal."""
+        return f'"{expr.value}"'
+    
+    def _generate_bool_literal(self, expr: BoolLiteral) -> str:
+        """Generate: True / False"""
+        return "True" if expr.value else "False"
+    
+    def _generate_identifier(self, expr: Identifier) -> str:
+        """Generate identifier reference."""
+        return expr.name
     
     def _generate_binary_expr(self, expr: BinaryExpr) -> str:
         """Generate binary expression with defensive parentheses.
@@ -461,6 +554,8 @@ class CodeGenerator:
         Always wraps result in parentheses to preserve operator precedence.
         Python handles redundant parentheses gracefully.
         """
+        if self._fold_constants:
+            return self._generate_folded(expr)[0]
         left = self._generate_expression(expr.left)
         right = self._generate_expression(expr.right)
         op = self._binary_op_to_python(expr.operator)
@@ -468,15 +563,50 @@ class CodeGenerator:
     
     def _generate_unary_expr(self, expr: UnaryExpr) -> str:
         """Generate unary expression."""
+        if self._fold_constants:
+            return self._generate_folded(expr)[0]
         operand = self._generate_expression(expr.operand)
-        
-        if expr.operator == UnaryOp.NEG:
+        return self._unary_op_to_python(expr.operator, operand)
+    
+    def _unary_op_to_python(self, operator: UnaryOp, operand: str) -> str:
+        """Apply a unary operator to generated operand code."""
+        if operator == UnaryOp.NEG:
             return f"-{operand}"
-        elif expr.operator == UnaryOp.NOT:
+        elif operator == UnaryOp.NOT:
             return f"not {operand}"
         else:
             return operand
     
+    def _generate_folded(self, expr) -> tuple[str, int | float | bool | None]:
+        """
+        Generate an expression with constant folding, bottom-up in one pass.
+        
+        Each node is visited once: children report their constant value
+        along with their code, so parents never re-walk a subtree.
+        
+        Returns:
+            The generated code, and the expression's value if it is built
+            only from int, float and bool literals (None otherwise).
+        """
+        if type(expr) in (IntLiteral, FloatLiteral, BoolLiteral):
+            return self._generate_expression(expr), expr.value
+        if type(expr) is UnaryExpr:
+            operand_code, operand = self._generate_folded(expr.operand)
+            if operand is not None:
+                value = _fold_unary(expr.operator, operand)
+                return repr(value), value
+            return self._unary_op_to_python(expr.operator, operand_code), None
+        if type(expr) is BinaryExpr:
+            left_code, left = self._generate_folded(expr.left)
+            right_code, right = self._generate_folded(expr.right)
+            if left is not None and right is not None:
+                value = _fold_binary(expr.operator, left, right)
+                if value is not None:
+                    return repr(value), value
+            op = self._binary_op_to_python(expr.operator)
+            return f"({left_code} {op} {right_code})", None
+        return self._generate_expression(expr), None
+    
     def _generate_call_expr(self, expr: CallExpr) -> str:
         """Generate function call.
         
@@ -553,25 +683,7 @@ class CodeGenerator:
     
     def _binary_op_to_python(self, op: BinaryOp) -> str:
         """Convert Quasar binary operator to Python operator."""
-        mapping = {
-            # Arithmetic
-            BinaryOp.ADD: "+",
-            BinaryOp.SUB: "-",
-            BinaryOp.MUL: "*",
-            BinaryOp.DIV: "/",
-            BinaryOp.MOD: "%",
-            # Comparison
-            BinaryOp.EQ: "==",
-            BinaryOp.NE: "!=",
-            BinaryOp.LT: "<",
-            BinaryOp.GT: ">",
-            BinaryOp.LE: "<=",
-            BinaryOp.GE: ">=",
-            # Logical (Quasar && || → Python and or)
-            BinaryOp.AND: "and",
-            BinaryOp.OR: "or",
-        }
-        return mapping.get(op, str(op))
+        return _BINARY_OP_TO_PYTHON.get(op, str(op))
 
     def _generate_struct_decl(self, decl: StructDecl) -> None:
         """
@@ -776,3 +888,47 @@ class CodeGenerator:
         # Default: obj.method(args) — works for upper, lower, split, replace, pop, reverse, clear, get
         args_str = ", ".join(args)
         return f"{obj}.{expr.method}({args_str})"
+    
+    # Dispatch Tables
+    # =========================================================================
+    # Keyed by exact node type and built once at class creation, so dispatch
+    # is a single dict lookup instead of an isinstance chain.
+    
+    _DECLARATION_HANDLERS = {
+        VarDecl: _generate_var_decl,
+        ConstDecl: _generate_const_decl,
+        FnDecl: _generate_fn_decl,
+        StructDecl: _generate_struct_decl,
+        EnumDecl: _generate_enum_decl,
+        ImportDecl: _generate_import_decl,
+        ExpressionStmt: _generate_expression_stmt,
+        IfStmt: _generate_if_stmt,
+        WhileStmt: _generate_while_stmt,
+        ForStmt: _generate_for_stmt,
+        ReturnStmt: _generate_return_stmt,
+        BreakStmt: _generate_break_stmt,
+        ContinueStmt: _generate_continue_stmt,
+        PrintStmt: _generate_print_stmt,
+        AssignStmt: _generate_assign_stmt,
+        IndexAssignStmt: _generate_index_assign_stmt,
+        MemberAssignStmt: _generate_member_assign_stmt,
+        Block: _generate_block,
+    }
+    
+    _EXPRESSION_HANDLERS = {
+        IntLiteral: _generate_number_literal,
+        FloatLiteral: _generate_number_literal,
+        StringLiteral: _generate_string_literal,
+        BoolLiteral: _generate_bool_literal,
+        Identifier: _generate_identifier,
+        BinaryExpr: _generate_binary_expr,
+        UnaryExpr: _generate_unary_expr,
+        CallExpr: _generate_call_expr,
+        ListLiteral: _generate_list_literal,
+        IndexExpr: _generate_index_expr,
+        RangeExpr: _generate_range_expr,
+        StructInitExpr: _generate_struct_init_expr,
+        MemberAccessExpr: _generate_member_access_expr,
+        DictLiteral: _generate_dict_literal,
+        MethodCallExpr: _generate_method_call_expr,
+    }
@@ -5,12 +5,22 @@ This module implements the Lexer class that converts Quasar source
 code into a sequence of tokens according to the Phase 1 lexical specification.
 """
 
+import re
+from collections.abc import Callable
+
 from quasar.ast.span import Span
 from quasar.lexer.errors import LexerError
 from quasar.lexer.token import Token
 from quasar.lexer.token_type import KEYWORDS, TokenType
 
 
+# Whitespace other than newlines, which _advance() must see one at a time
+_INLINE_SPACE = re.compile(r"[ \t\r]*")
+
+# Identifier continuation: \w is exactly str.isalnum() plus "_" for str patterns
+_IDENTIFIER_TAIL = re.compile(r"\w*")
+
+
 class Lexer:
     """
     Lexical analyzer for Quasar source code.
@@ -120,6 +130,24 @@ class Lexer:
         
         return char
     
+    def _advance_to(self, end: int) -> None:
+        """
+        Consume every character up to (not including) index ``end``.
+        
+        The skipped run must not contain a newline, so only the column moves.
+        """
+        self._column += end - self._current
+        self._current = end
+    
+    def _scan_while(self, predicate: Callable[[str], bool]) -> None:
+        """Consume characters on the current line while predicate(char) holds."""
+        source = self._source
+        end = self._current
+        length = len(source)
+        while end < length and predicate(source[end]):
+            end += 1
+        self._advance_to(end)
+    
     def _match(self, expected: str) -> bool:
         """
         Consume current character if it matches expected.
@@ -238,11 +266,14 @@ class Lexer:
             
             # Comment (discard until end of line)
             case "#":
-                while self._peek() != "\n" and not self._is_at_end():
-                    self._advance()
+                end = self._source.find("\n", self._current)
+                self._advance_to(len(self._source) if end == -1 else end)
             
-            # Whitespace (ignore)
-            case " " | "\t" | "\r" | "\n":
+            # Whitespace (ignore); newlines are consumed one at a time
+            # so _advance() keeps the line count
+            case " " | "\t" | "\r":
+                self._advance_to(_INLINE_SPACE.match(self._source, self._current).end())
+            case "\n":
                 pass
             
             # Dot or range operator (. or ..)
@@ -274,17 +305,22 @@ class Lexer:
         start_column = self._start_column
         
         # Consume characters until closing quote or end of input
-        while self._peek() != '"' and not self._is_at_end():
-            if self._peek() == "\n":
-                # Strings cannot span multiple lines (no escape sequences)
-                self._error("unterminated string literal")
-                return
-            self._advance()
+        source = self._source
+        quote = source.find('"', self._current)
+        newline = source.find("\n", self._current, None if quote == -1 else quote)
+        if newline != -1:
+            # Strings cannot span multiple lines (no escape sequences)
+            self._advance_to(newline)
+            self._error("unterminated string literal")
+            return
         
-        if self._is_at_end():
+        if quote == -1:
+            self._advance_to(len(source))
             self._error("unterminated string literal")
             return
         
+        self._advance_to(quote)
+        
         # Consume the closing quote
         self._advance()
         
@@ -295,8 +331,7 @@ class Lexer:
     def _scan_number(self) -> None:
         """Scan an integer or float literal."""
         # Consume all digits
-        while self._peek().isdigit():
-            self._advance()
+        self._scan_while(str.isdigit)
         
         # Check for decimal point
         if self._peek() == "." and self._peek_next().isdigit():
@@ -304,8 +339,7 @@ class Lexer:
             self._advance()
             
             # Consume fractional digits
-            while self._peek().isdigit():
-                self._advance()
+            self._scan_while(str.isdigit)
             
             # It's a float
             value = float(self._source[self._start:self._current])
@@ -318,8 +352,7 @@ class Lexer:
     def _scan_identifier(self) -> None:
         """Scan an identifier or keyword."""
         # Consume alphanumeric characters and underscores
-        while self._peek().isalnum() or self._peek() == "_":
-            self._advance()
+        self._advance_to(_IDENTIFIER_TAIL.match(self._source, self._current).end())
         
         # Check if it's a keyword
         text = self._source[self._start:self._current]
@@ -337,3 +370,4 @@ class Lexer:
         else:
             # It's an identifier
             self._add_token(TokenType.IDENTIFIER)
+
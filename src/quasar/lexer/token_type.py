@@ -98,6 +98,11 @@ class TokenType(Enum):
     # === Special (1) ===
     EOF = auto()        # End of file
     
+    # The parser indexes _BINARY_OPERATORS and _UNARY_OPERATORS by token type
+    # at nearly every expression token; hash by identity (matching identity
+    # equality) instead of Enum's Python-level hash of the member name.
+    __hash__ = object.__hash__
+    
     def __repr__(self) -> str:
         """Deterministic representation for snapshots."""
         return f"TokenType.{self.name}"
@@ -129,6 +129,31 @@ from quasar.lexer.token_type import TokenType
 from quasar.parser.errors import ParserError
 
 
+# Binary operator token → (precedence, operator), matching the precedence
+# table above. Every level is left-associative.
+_BINARY_OPERATORS: dict[TokenType, tuple[int, BinaryOp]] = {
+    TokenType.OR_OR: (1, BinaryOp.OR),
+    TokenType.AND_AND: (2, BinaryOp.AND),
+    TokenType.EQUAL_EQUAL: (3, BinaryOp.EQ),
+    TokenType.BANG_EQUAL: (3, BinaryOp.NE),
+    TokenType.LESS: (4, BinaryOp.LT),
+    TokenType.GREATER: (4, BinaryOp.GT),
+    TokenType.LESS_EQUAL: (4, BinaryOp.LE),
+    TokenType.GREATER_EQUAL: (4, BinaryOp.GE),
+    TokenType.PLUS: (5, BinaryOp.ADD),
+    TokenType.MINUS: (5, BinaryOp.SUB),
+    TokenType.STAR: (6, BinaryOp.MUL),
+    TokenType.SLASH: (6, BinaryOp.DIV),
+    TokenType.PERCENT: (6, BinaryOp.MOD),
+}
+
+# Prefix operator token → UnaryOp.
+_UNARY_OPERATORS: dict[TokenType, UnaryOp] = {
+    TokenType.BANG: UnaryOp.NOT,
+    TokenType.MINUS: UnaryOp.NEG,
+}
+
+
 class Parser:
     """
     Recursive descent parser for Quasar.
@@ -211,9 +236,8 @@ class Parser:
     
     def _check(self, *types: TokenType) -> bool:
         """Check if current token is of any given type."""
-        if self._is_at_end():
-            return False
-        return self._peek().type in types
+        token_type = self._tokens[self._current].type
+        return token_type is not TokenType.EOF and token_type in types
     
     def _match(self, *types: TokenType) -> bool:
         """
@@ -222,10 +246,9 @@ class Parser:
         Returns:
             True if matched and consumed, False otherwise.
         """
-        for token_type in types:
-            if self._check(token_type):
-                self._advance()
-                return True
+        if self._check(*types):
+            self._current += 1
+            return True
         return False
     
     def _consume(self, token_type: TokenType, message: str) -> Token:
@@ -742,10 +765,10 @@ class Parser:
         Precedence: 0 (lowest)
         Not associative (a..b..c is invalid)
         """
-        left = self._logic_or()
+        left = self._binary()
         
         if self._match(TokenType.DOTDOT):
-            right = self._logic_or()
+            right = self._binary()
             return RangeExpr(
                 start=left,
                 end=right,
@@ -754,157 +777,30 @@ class Parser:
         
         return left
     
-    def _logic_or(self) -> Expression:
-        """
-        Parse logical OR expression.
-        
-        logic_or → logic_and ("||" logic_and)*
-        
-        Precedence: 1 (lowest)
-        Associativity: left
-        """
-        expr = self._logic_and()
-        
-        while self._match(TokenType.OR_OR):
-            operator = BinaryOp.OR
-            right = self._logic_and()
-            expr = BinaryExpr(
-                left=expr,
-                operator=operator,
-                right=right,
-                span=self._merge_spans(expr.span, right.span),
-            )
-        
-        return expr
-    
-    def _logic_and(self) -> Expression:
-        """
-        Parse logical AND expression.
-        
-        logic_and → equality ("&&" equality)*
-        
-        Precedence: 2
-        Associativity: left
-        """
-        expr = self._equality()
-        
-        while self._match(TokenType.AND_AND):
-            operator = BinaryOp.AND
-            right = self._equality()
-            expr = BinaryExpr(
-                left=expr,
-                operator=operator,
-                right=right,
-                span=self._merge_spans(expr.span, right.span),
-            )
-        
-        return expr
-    
-    def _equality(self) -> Expression:
-        """
-        Parse equality expression.
-        
-        equality → comparison (("==" | "!=") comparison)*
-        
-        Precedence: 3
-        Associativity: left
-        """
-        expr = self._comparison()
-        
-        while self._match(TokenType.EQUAL_EQUAL, TokenType.BANG_EQUAL):
-            op_token = self._previous()
-            operator = BinaryOp.EQ if op_token.type == TokenType.EQUAL_EQUAL else BinaryOp.NE
-            right = self._comparison()
-            expr = BinaryExpr(
-                left=expr,
-                operator=operator,
-                right=right,
-                span=self._merge_spans(expr.span, right.span),
-            )
-        
-        return expr
-    
-    def _comparison(self) -> Expression:
-        """
-        Parse comparison expression.
-        
-        comparison → term (("<" | ">" | "<=" | ">=") term)*
-        
-        Precedence: 4
-        Associativity: left
-        """
-        expr = self._term()
-        
-        while self._match(TokenType.LESS, TokenType.GREATER, 
-                          TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL):
-            op_token = self._previous()
-            operator = {
-                TokenType.LESS: BinaryOp.LT,
-                TokenType.GREATER: BinaryOp.GT,
-                TokenType.LESS_EQUAL: BinaryOp.LE,
-                TokenType.GREATER_EQUAL: BinaryOp.GE,
-            }[op_token.type]
-            right = self._term()
-            expr = BinaryExpr(
-                left=expr,
-                operator=operator,
-                right=right,
-                span=self._merge_spans(expr.span, right.span),
-            )
-        
-        return expr
-    
-    def _term(self) -> Expression:
+    def _binary(self, min_precedence: int = 1) -> Expression:
         """
-        Parse term expression (addition/subtraction).
+        Parse a binary expression by precedence climbing.
         
-        term → factor (("+" | "-") factor)*
+        Covers logic_or down to factor in the grammar: one loop driven by
+        _BINARY_OPERATORS instead of one method per precedence level.
         
-        Precedence: 5
-        Associativity: left
-        """
-        expr = self._factor()
-        
-        while self._match(TokenType.PLUS, TokenType.MINUS):
-            op_token = self._previous()
-            operator = BinaryOp.ADD if op_token.type == TokenType.PLUS else BinaryOp.SUB
-            right = self._factor()
-            expr = BinaryExpr(
-                left=expr,
-                operator=operator,
-                right=right,
-                span=self._merge_spans(expr.span, right.span),
-            )
-        
-        return expr
-    
-    def _factor(self) -> Expression:
-        """
-        Parse factor expression (multiplication/division/modulo).
-        
-        factor → unary (("*" | "/" | "%") unary)*
-        
-        Precedence: 6
-        Associativity: left
+        Associativity: left (operands on the right bind one level tighter)
         """
         expr = self._unary()
         
-        while self._match(TokenType.STAR, TokenType.SLASH, TokenType.PERCENT):
-            op_token = self._previous()
-            operator = {
-                TokenType.STAR: BinaryOp.MUL,
-                TokenType.SLASH: BinaryOp.DIV,
-                TokenType.PERCENT: BinaryOp.MOD,
-            }[op_token.type]
-            right = self._unary()
+        while True:
+            entry = _BINARY_OPERATORS.get(self._tokens[self._current].type)
+            if entry is None or entry[0] < min_precedence:
+                return expr
+            precedence, operator = entry
+            self._current += 1
+            right = self._binary(precedence + 1)
             expr = BinaryExpr(
                 left=expr,
                 operator=operator,
                 right=right,
                 span=self._merge_spans(expr.span, right.span),
             )
-        
-        return expr
     
     def _unary(self) -> Expression:
         """
@@ -915,9 +811,10 @@ class Parser:
         Precedence: 7
         Associativity: right
         """
-        if self._match(TokenType.BANG, TokenType.MINUS):
-            op_token = self._previous()
-            operator = UnaryOp.NOT if op_token.type == TokenType.BANG else UnaryOp.NEG
+        op_token = self._tokens[self._current]
+        operator = _UNARY_OPERATORS.get(op_token.type)
+        if operator is not None:
+            self._current += 1
             operand = self._unary()  # Right associative
             return UnaryExpr(
                 operator=operator,
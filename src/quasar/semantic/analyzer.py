@@ -152,6 +152,26 @@ PRIMITIVE_METHODS: dict[str, dict[str, MethodSignature]] = {
 }
 
 
+# Phase 13: Static builtin modules (File, Env)
+# These are reserved names that cannot be shadowed
+# Mapping: name -> method -> signature
+STATIC_OBJECTS: dict[str, dict[str, MethodSignature]] = {
+    "File": {
+        "read": MethodSignature(params=[("path", STR)], returns=STR),
+        "write": MethodSignature(params=[("path", STR), ("content", STR)], returns=VOID),
+        "append": MethodSignature(params=[("path", STR), ("content", STR)], returns=VOID),
+        "exists": MethodSignature(params=[("path", STR)], returns=BOOL),
+        "delete": MethodSignature(params=[("path", STR)], returns=VOID),
+    },
+    "Env": {
+        "get": MethodSignature(params=[("key", STR), ("default", STR)], returns=STR),
+        "set": MethodSignature(params=[("key", STR), ("value", STR)], returns=VOID),
+        "args": MethodSignature(params=[], returns=ListType(STR)),
+        "cwd": MethodSignature(params=[], returns=STR),
+    },
+}
+
+
 class SemanticAnalyzer:
     """
     Performs semantic analysis on a Quasar AST.
@@ -215,6 +235,16 @@ class SemanticAnalyzer:
     
     def __init__(self) -> None:
         """Initialize the semantic analyzer."""
+        self.reset()
+        self._static_objects = STATIC_OBJECTS
+    
+    def reset(self) -> None:
+        """
+        Clear all per-program state so the analyzer can be reused.
+        
+        analyze() accumulates symbols and type definitions; call reset()
+        before analyzing an unrelated program with the same instance.
+        """
         self._symbols = SymbolTable()
         self._loop_depth = 0  # Track nesting in while loops
         self._current_function_return_type: Optional[TypeAnnotation] = None
@@ -224,25 +254,6 @@ class SemanticAnalyzer:
         self._imported_modules: dict[str, ModuleSymbol] = {}
         # Store enum definitions: name -> list of variant names (Phase 12)
         self._defined_enums: dict[str, list[str]] = {}
-        # Static objects (Phase 13): File, Env
-        # Mapping: name -> method -> (param_types_list, return_type)
-        # Phase 13: Static builtin modules (File, Env)
-        # These are reserved names that cannot be shadowed
-        self._static_objects: dict[str, dict[str, MethodSignature]] = {
-            "File": {
-                "read": MethodSignature(params=[("path", STR)], returns=STR),
-                "write": MethodSignature(params=[("path", STR), ("content", STR)], returns=VOID),
-                "append": MethodSignature(params=[("path", STR), ("content", STR)], returns=VOID),
-                "exists": MethodSignature(params=[("path", STR)], returns=BOOL),
-                "delete": MethodSignature(params=[("path", STR)], returns=VOID),
-            },
-            "Env": {
-                "get": MethodSignature(params=[("key", STR), ("default", STR)], returns=STR),
-                "set": MethodSignature(params=[("key", STR), ("value", STR)], returns=VOID),
-                "args": MethodSignature(params=[], returns=ListType(STR)),
-                "cwd": MethodSignature(params=[], returns=STR),
-            },
-        }
     
     def analyze(self, program: Program) -> Program:
         """
@@ -260,42 +271,9 @@ class SemanticAnalyzer:
     
     def _analyze_declaration(self, decl) -> None:
         """Dispatch declaration analysis based on type."""
-        if isinstance(decl, VarDecl):
-            self._analyze_var_decl(decl)
-        elif isinstance(decl, ConstDecl):
-            self._analyze_const_decl(decl)
-        elif isinstance(decl, FnDecl):
-            self._analyze_fn_decl(decl)
-        elif isinstance(decl, StructDecl):
-            self._analyze_struct_decl(decl)
-        elif isinstance(decl, ImportDecl):
-            self._analyze_import_decl(decl)
-        elif isinstance(decl, EnumDecl):
-            self._analyze_enum_decl(decl)
-        elif isinstance(decl, ExpressionStmt):
-            self._analyze_expression_stmt(decl)
-        elif isinstance(decl, IfStmt):
-            self._analyze_if_stmt(decl)
-        elif isinstance(decl, WhileStmt):
-            self._analyze_while_stmt(decl)
-        elif isinstance(decl, ForStmt):
-            self._analyze_for_stmt(decl)
-        elif isinstance(decl, ReturnStmt):
-            self._analyze_return_stmt(decl)
-        elif isinstance(decl, BreakStmt):
-            self._analyze_break_stmt(decl)
-        elif isinstance(decl, ContinueStmt):
-            self._analyze_continue_stmt(decl)
-        elif isinstance(decl, PrintStmt):
-            self._analyze_print_stmt(decl)
-        elif isinstance(decl, AssignStmt):
-            self._analyze_assign_stmt(decl)
-        elif isinstance(decl, IndexAssignStmt):
-            self._analyze_index_assign_stmt(decl)
-        elif isinstance(decl, MemberAssignStmt):
-            self._analyze_member_assign_stmt(decl)
-        elif isinstance(decl, Block):
-            self._analyze_block(decl)
+        handler = self._DECLARATION_HANDLERS.get(type(decl))
+        if handler is not None:
+            handler(self, decl)
     
     def _analyze_var_decl(self, decl: VarDecl) -> None:
         """
@@ -894,63 +872,42 @@ class SemanticAnalyzer:
         
         Also validates the expression for semantic errors.
         """
-        if isinstance(expr, IntLiteral):
-            return INT
-        elif isinstance(expr, FloatLiteral):
-            return FLOAT
-        elif isinstance(expr, StringLiteral):
-            return STR
-        elif isinstance(expr, BoolLiteral):
-            return BOOL
-        elif isinstance(expr, Identifier):
-            return self._get_identifier_type(expr)
-        elif isinstance(expr, BinaryExpr):
-            return self._get_binary_expr_type(expr)
-        elif isinstance(expr, UnaryExpr):
-            return self._get_unary_expr_type(expr)
-        elif isinstance(expr, CallExpr):
-            return self._get_call_expr_type(expr)
-        elif isinstance(expr, ListLiteral):
-            return self._get_list_literal_type(expr)
-        elif isinstance(expr, IndexExpr):
-            return self._get_index_expr_type(expr)
-        elif isinstance(expr, RangeExpr):
-            # RangeExpr is validated in _analyze_for_stmt
-            # If we get here, it's being used outside a for loop context
-            # which is technically valid but the type is "range" (treated as list[int] for now)
-            # Validate the operands are int
-            start_type = self._get_expression_type(expr.start)
-            end_type = self._get_expression_type(expr.end)
-            if start_type != INT:
-                raise SemanticError(
-                    code="E0504",
-                    message=f"range start must be int, got {start_type}",
-                    span=expr.start.span,
-                )
-            if end_type != INT:
-                raise SemanticError(
-                    code="E0504",
-                    message=f"range end must be int, got {end_type}",
-                    span=expr.end.span,
-                )
-            # Return a marker type - range is iterable of int
-            # We use ListType(INT) as a stand-in since ranges are int iterables
-            return ListType(INT)
-        elif isinstance(expr, StructInitExpr):
-            return self._get_struct_init_expr_type(expr)
-        elif isinstance(expr, MemberAccessExpr):
-            return self._get_member_access_expr_type(expr)
-        elif isinstance(expr, DictLiteral):
-            return self._get_dict_literal_type(expr)
-        elif isinstance(expr, MethodCallExpr):
-            return self._get_method_call_expr_type(expr)
-        else:
+        literal_type = self._LITERAL_TYPES.get(type(expr))
+        if literal_type is not None:
+            return literal_type
+        handler = self._EXPRESSION_HANDLERS.get(type(expr))
+        if handler is None:
             # Should not reach here with valid AST
             raise SemanticError(
                 code="E0000",
                 message=f"unknown expression type: {type(expr).__name__}",
                 span=expr.span,
             )
+        return handler(self, expr)
+    
+    def _get_range_expr_type(self, expr: RangeExpr) -> QuasarType:
+        """Type a range used outside a for header."""
+        # RangeExpr is validated in _analyze_for_stmt
+        # If we get here, it's being used outside a for loop context
+        # which is technically valid but the type is "range" (treated as list[int] for now)
+        # Validate the operands are int
+        start_type = self._get_expression_type(expr.start)
+        end_type = self._get_expression_type(expr.end)
+        if start_type != INT:
+            raise SemanticError(
+                code="E0504",
+                message=f"range start must be int, got {start_type}",
+                span=expr.start.span,
+            )
+        if end_type != INT:
+            raise SemanticError(
+                code="E0504",
+                message=f"range end must be int, got {end_type}",
+                span=expr.end.span,
+            )
+        # Return a marker type - range is iterable of int
+        # We use ListType(INT) as a stand-in since ranges are int iterables
+        return ListType(INT)
     
     def _get_list_literal_type(self, expr: ListLiteral) -> ListType:
         """
@@ -2083,3 +2040,49 @@ class SemanticAnalyzer:
             return type_marker
         
         return type_marker
+    
+    # Dispatch Tables
+    # =========================================================================
+    # Keyed by exact node type, mirroring CodeGenerator's tables.
+    
+    _DECLARATION_HANDLERS = {
+        VarDecl: _analyze_var_decl,
+        ConstDecl: _analyze_const_decl,
+        FnDecl: _analyze_fn_decl,
+        StructDecl: _analyze_struct_decl,
+        ImportDecl: _analyze_import_decl,
+        EnumDecl: _analyze_enum_decl,
+        ExpressionStmt: _analyze_expression_stmt,
+        IfStmt: _analyze_if_stmt,
+        WhileStmt: _analyze_while_stmt,
+        ForStmt: _analyze_for_stmt,
+        ReturnStmt: _analyze_return_stmt,
+        BreakStmt: _analyze_break_stmt,
+        ContinueStmt: _analyze_continue_stmt,
+        PrintStmt: _analyze_print_stmt,
+        AssignStmt: _analyze_assign_stmt,
+        IndexAssignStmt: _analyze_index_assign_stmt,
+        MemberAssignStmt: _analyze_member_assign_stmt,
+        Block: _analyze_block,
+    }
+    
+    _LITERAL_TYPES = {
+        IntLiteral: INT,
+        FloatLiteral: FLOAT,
+        StringLiteral: STR,
+        BoolLiteral: BOOL,
+    }
+    
+    _EXPRESSION_HANDLERS = {
+        Identifier: _get_identifier_type,
+        BinaryExpr: _get_binary_expr_type,
+        UnaryExpr: _get_unary_expr_type,
+        CallExpr: _get_call_expr_type,
+        ListLiteral: _get_list_literal_type,
+        IndexExpr: _get_index_expr_type,
+        RangeExpr: _get_range_expr_type,
+        StructInitExpr: _get_struct_init_expr_type,
+        MemberAccessExpr: _get_member_access_expr_type,
+        DictLiteral: _get_dict_literal_type,
+        MethodCallExpr: _get_method_call_expr_type,
+    }
@@ -0,0 +1,8 @@
+"""
+Small helpers shared across the test suite.
+"""
+
+
+def head_lines(output: str, n: int) -> list[str]:
+    """Return the first n lines of stripped output, splitting no further."""
+    return output.strip().split("\n", n)[:n]
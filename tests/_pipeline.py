@@ -0,0 +1,122 @@
+"""
+Shared Quasar compile pipeline for test helpers.
+
+Test modules used to define their own lex/parse/generate helpers; they
+import them from here instead so each unique source is compiled once per
+session.
+"""
+
+import contextlib
+import functools
+import io
+import os
+import subprocess
+import sys
+from types import CodeType
+
+from quasar.ast import Program
+from quasar.lexer import Lexer, Token
+from quasar.parser import Parser
+from quasar.semantic import SemanticAnalyzer
+from quasar.codegen import CodeGenerator
+
+
+# Phase 13 imports that CodeGenerator always emits first.
+_Q_IMPORT_PREFIX = "import os as _q_os\nimport sys as _q_sys\n"
+
+
+# Shared instances, reset before each use.
+_ANALYZER = SemanticAnalyzer()
+_CODEGEN = CodeGenerator()
+_FOLDING_CODEGEN = CodeGenerator(fold_constants=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize_to_tuple(source: str, filename: str) -> tuple[Token, ...]:
+    """Backing cache for tokenize()."""
+    return tuple(Lexer(source, filename).tokenize())
+
+
+def tokenize(source: str, filename: str = "<stdin>") -> list[Token]:
+    """
+    Tokenize Quasar source, reusing the tokens of earlier identical calls.
+    
+    Tokens are immutable, so the cached stream is shared; each call returns
+    a fresh list. Lexer errors are raised, not cached.
+    """
+    return list(_tokenize_to_tuple(source, filename))
+
+
+def analyze(source: str) -> Program:
+    """Parse and semantically analyze Quasar source with the shared analyzer."""
+    ast = Parser(Lexer(source).tokenize()).parse()
+    _ANALYZER.reset()
+    return _ANALYZER.analyze(ast)
+
+
+@functools.lru_cache(maxsize=None)
+def run_pipeline(source: str, *, semantic: bool = False, fold_constants: bool = False) -> str:
+    """
+    Compile Quasar source to Python code.
+    
+    semantic runs the analyzer first; fold_constants generates with
+    CodeGenerator(fold_constants=True).
+    """
+    if semantic:
+        ast = analyze(source)
+    else:
+        ast = Parser(Lexer(source).tokenize()).parse()
+    codegen = _FOLDING_CODEGEN if fold_constants else _CODEGEN
+    return codegen.generate(ast)
+
+
+@functools.lru_cache(maxsize=512)
+def compile_python(code: str) -> CodeType:
+    """Compile generated Python code, reusing the code object for repeats."""
+    return compile(code, "<quasar-e2e>", "exec")
+
+
+def run_python(code: str) -> str:
+    """
+    Execute generated Python and return what it printed.
+    
+    Runs in-process with stdout redirected; set QUASAR_E2E_SUBPROCESS=1 to
+    execute in a fresh interpreter instead.
+    
+    Raises:
+        RuntimeError: If the code raises or exits with a non-zero status.
+    """
+    if os.environ.get("QUASAR_E2E_SUBPROCESS") == "1":
+        result = subprocess.run(
+            # -I: isolated (no env vars, no user site), -S: skip site, -B: no .pyc
+            [sys.executable, "-I", "-S", "-B", "-c", code],
+            capture_output=True,
+            timeout=5,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Execution failed: exit status {result.returncode}\n"
+                f"{result.stderr.decode('utf-8')}\n{code}"
+            )
+        return result.stdout.decode("utf-8")
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            exec(compile_python(code), {"__name__": "__main__"})
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"Execution failed: exit status {e.code!r}\n{code}") from e
+    except Exception as e:
+        raise RuntimeError(f"Execution failed: {e!r}\n{code}") from e
+    return buf.getvalue()
+
+
+def generate(source: str, *, fold_constants: bool = False) -> str:
+    """Generate code from Quasar source without the Phase 13 imports."""
+    code = run_pipeline(source, fold_constants=fold_constants)
+    # Strip Phase 13 imports for legacy tests
+    if code.startswith(_Q_IMPORT_PREFIX):
+        code = code[len(_Q_IMPORT_PREFIX):]
+        if code.startswith("\n"):
+            code = code[1:]
+    return code
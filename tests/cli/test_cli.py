@@ -40,6 +40,20 @@ class TestCLIParser:
         args = parser.parse_args(["run", "test.qsr"])
         assert args.command == "run"
         assert args.file == "test.qsr"
+        assert args.legacy_format is False
+    
+    def test_legacy_format_flag(self):
+        """Should parse --legacy-format for compile and run."""
+        parser = create_parser()
+        assert parser.parse_args(["compile", "test.qsr", "--legacy-format"]).legacy_format
+        assert parser.parse_args(["run", "test.qsr", "--legacy-format"]).legacy_format
+    
+    def test_fold_constants_flag(self):
+        """Should parse --fold-constants for compile and run."""
+        parser = create_parser()
+        assert not parser.parse_args(["compile", "test.qsr"]).fold_constants
+        assert parser.parse_args(["compile", "test.qsr", "--fold-constants"]).fold_constants
+        assert parser.parse_args(["run", "test.qsr", "--fold-constants"]).fold_constants
     
     def test_check_command_parsing(self):
         """Should parse check command."""
@@ -92,6 +106,19 @@ class TestCompileSource:
         assert "def add(a, b):" in result
         assert "return (a + b)" in result
     
+    def test_compile_format_print(self):
+        """Formatted print compiles to an f-string unless legacy_format is set."""
+        source = 'let x: int = 42\nprint("Val: {}", x)'
+        assert 'print(f"Val: {x}")' in compile_source(source)
+        with pytest.warns(DeprecationWarning):
+            assert 'print("Val: {}".format(x))' in compile_source(source, legacy_format=True)
+    
+    def test_compile_fold_constants(self):
+        """Literal-only expressions are folded only when fold_constants is set."""
+        source = "let x: int = (2 + 3) * 4"
+        assert "x = ((2 + 3) * 4)" in compile_source(source)
+        assert "x = 20" in compile_source(source, fold_constants=True)
+    
     def test_compile_invalid_syntax(self):
         """Should exit on syntax error."""
         with pytest.raises(SystemExit) as exc_info:
@@ -169,6 +196,18 @@ class TestMainFunction:
             
             Path(f.name).unlink()
     
+    def test_main_run_executes_in_process(self, capsys):
+        """run should execute generated code in the current interpreter."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".qsr", delete=False) as f:
+            f.write('print("in-process")')
+            f.flush()
+            
+            result = main(["run", f.name])
+            assert result == 0
+            assert capsys.readouterr().out == "in-process\n"
+            
+            Path(f.name).unlink()
+    
     def test_main_compile_invalid_file(self):
         """Should fail on invalid source."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".qsr", delete=False) as f:
@@ -8,19 +8,12 @@ Note: Quasar grammar does NOT use semicolons as statement terminators.
 
 import pytest
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.codegen import CodeGenerator
+from quasar.ast import BinaryOp
+from quasar.codegen.generator import _BINARY_OP_EVAL, _BINARY_OP_TO_PYTHON
+from tests._pipeline import generate
 
 
-def generate(source: str) -> str:
-    """Helper to parse and generate code from Quasar source."""
-    tokens = Lexer(source).tokenize()
-    ast = Parser(tokens).parse()
-    code = CodeGenerator().generate(ast)
-    # Strip Phase 13 imports for legacy tests
-    code = code.replace("import os as _q_os\nimport sys as _q_sys\n\n", "")
-    return code
+pytestmark = pytest.mark.codegen_pure
 
 
 class TestArithmeticOperators:
@@ -187,3 +180,50 @@ class TestPrecedence:
         source = "let x: bool = 1 < 2 && 3 > 1"
         result = generate(source)
         assert result == "x = ((1 < 2) and (3 > 1))"
+
+
+class TestConstantFolding:
+    """Tests for CodeGenerator(fold_constants=True)."""
+    
+    @pytest.mark.parametrize("source, expected", [
+        pytest.param("let x: int = (2 + 3) * 4", "x = 20", id="int_arithmetic"),
+        pytest.param("let x: int = (1 + 2 + 3 + 4) * 10", "x = 100", id="nested_sum"),
+        pytest.param("let x: float = (6 + 4) / 2", "x = 5.0", id="true_division"),
+        pytest.param("let x: float = (10.0 + 20.0 + 30.0) / 3.0", "x = 20.0", id="float_average"),
+        pytest.param("let x: int = 7 % 3", "x = 1", id="modulo"),
+        pytest.param("let x: int = -(3 - 10)", "x = 7", id="negation"),
+        pytest.param("let x: bool = (true || false) && false", "x = False", id="logic"),
+        pytest.param("let x: bool = !(1 < 2) || 3 >= 3", "x = True", id="comparison_and_not"),
+    ])
+    def test_folds_literal_expression(self, source, expected):
+        assert generate(source, fold_constants=True) == expected
+    
+    @pytest.mark.parametrize("source, expected", [
+        pytest.param("let x: int = 1 / 0", "x = (1 / 0)", id="division_by_zero"),
+        pytest.param("let x: int = 5 % 0", "x = (5 % 0)", id="modulo_by_zero"),
+        pytest.param('let s: str = "a" + "b"', 's = ("a" + "b")', id="string_concat"),
+    ])
+    def test_leaves_unsafe_expression(self, source, expected):
+        assert generate(source, fold_constants=True) == expected
+    
+    def test_folds_constant_subexpression(self):
+        """Only the literal-only operand is folded."""
+        source = "let y: int = 2\nlet x: int = y * (0 - 5)"
+        assert generate(source, fold_constants=True) == "y = 2\nx = (y * -5)"
+    
+    def test_disabled_by_default(self):
+        """Without fold_constants the expression is emitted as written."""
+        assert generate("let x: int = (2 + 3) * 4") == "x = ((2 + 3) * 4)"
+    
+    def test_folds_deep_chain(self):
+        """Every literal-only term of a long left-deep chain is folded."""
+        terms = " + ".join(["y"] + ["(1 + 2)"] * 50)
+        code = generate(f"let y: int = 2\nlet x: int = {terms}", fold_constants=True)
+        assert code == "y = 2\nx = " + "(" * 50 + "y" + " + 3)" * 50
+
+
+class TestOperatorTables:
+    """Codegen operator tables."""
+    
+    def test_tables_cover_every_binary_operator(self):
+        assert set(_BINARY_OP_TO_PYTHON) == set(_BINARY_OP_EVAL) == set(BinaryOp)
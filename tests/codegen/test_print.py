@@ -10,6 +10,9 @@ from quasar.semantic import SemanticAnalyzer
 from quasar.codegen import CodeGenerator
 
 
+pytestmark = pytest.mark.codegen_pure
+
+
 def generate(source: str) -> str:
     """Helper to parse and generate code from Quasar source."""
     tokens = Lexer(source).tokenize()
@@ -20,33 +23,26 @@ def generate(source: str) -> str:
     return code
 
 
+@pytest.fixture(scope="module")
+def compiled(request) -> str:
+    """Generated code for the indirectly parametrized source, once per module."""
+    return generate(request.param)
+
+
 class TestPrintStatementCodeGen:
     """Tests for print statement code generation."""
     
-    def test_codegen_print_int(self):
-        """print(42) → print(42)"""
-        code = generate("print(42)")
-        assert code == "print(42)"
-    
-    def test_codegen_print_float(self):
-        """print(3.14) → print(3.14)"""
-        code = generate("print(3.14)")
-        assert code == "print(3.14)"
-    
-    def test_codegen_print_true(self):
-        """print(true) → print(True)"""
-        code = generate("print(true)")
-        assert code == "print(True)"
-    
-    def test_codegen_print_false(self):
-        """print(false) → print(False)"""
-        code = generate("print(false)")
-        assert code == "print(False)"
-    
-    def test_codegen_print_string(self):
-        """print("hello") → print("hello")"""
-        code = generate('print("hello")')
-        assert code == 'print("hello")'
+    @pytest.mark.parametrize("compiled, expected", [
+        pytest.param("print(42)", "print(42)", id="int"),
+        pytest.param("print(3.14)", "print(3.14)", id="float"),
+        pytest.param("print(true)", "print(True)", id="true"),
+        pytest.param("print(false)", "print(False)", id="false"),
+        pytest.param('print("hello")', 'print("hello")', id="string"),
+        pytest.param("print(2 + 3)", "print((2 + 3))", id="expression"),
+    ], indirect=["compiled"])
+    def test_codegen_print_single_arg(self, compiled, expected):
+        """print(<arg>) → print(<python arg>)"""
+        assert compiled == expected
     
     def test_codegen_print_variable(self):
         """print(x) after let x = 5"""
@@ -55,11 +51,6 @@ class TestPrintStatementCodeGen:
         assert lines[0] == "x = 5"
         assert lines[1] == "print(x)"
     
-    def test_codegen_print_expression(self):
-        """print(2 + 3) → print(2 + 3)"""
-        code = generate("print(2 + 3)")
-        assert code == "print((2 + 3))"
-    
     def test_codegen_print_function_call(self):
         """print(f(5)) → print(f(5))"""
         source = """fn f(n: int) -> int {
@@ -120,50 +111,42 @@ print(3)"""
 class TestPrintMultipleArgsCodeGen:
     """Tests for print with multiple arguments (Phase 5.1)."""
     
-    def test_codegen_print_two_args(self):
-        """print(1, 2) → print(1, 2)"""
-        code = generate("print(1, 2)")
-        assert code == "print(1, 2)"
-    
-    def test_codegen_print_three_args(self):
-        """print(1, 2, 3) → print(1, 2, 3)"""
-        code = generate("print(1, 2, 3)")
-        assert code == "print(1, 2, 3)"
-    
-    def test_codegen_print_mixed_types(self):
-        """print with mixed types"""
-        code = generate('print("x =", 42, true)')
-        assert code == 'print("x =", 42, True)'
+    @pytest.mark.parametrize("compiled, expected", [
+        pytest.param("print(1, 2)", "print(1, 2)", id="two_args"),
+        pytest.param("print(1, 2, 3)", "print(1, 2, 3)", id="three_args"),
+        pytest.param('print("x =", 42, true)', 'print("x =", 42, True)', id="mixed_types"),
+        pytest.param("print(1 + 2, 3 * 4)", "print((1 + 2), (3 * 4))", id="expressions"),
+    ], indirect=["compiled"])
+    def test_codegen_print_multiple_args(self, compiled, expected):
+        """print(a, b, ...) → print(a, b, ...)"""
+        assert compiled == expected
     
     def test_codegen_print_variables(self):
         """print with multiple variables"""
         code = generate("let a: int = 1\nlet b: int = 2\nprint(a, b)")
         lines = code.split("\n")
         assert lines[2] == "print(a, b)"
-    
-    def test_codegen_print_expressions(self):
-        """print with expressions"""
-        code = generate("print(1 + 2, 3 * 4)")
-        assert code == "print((1 + 2), (3 * 4))"
 
 
 class TestPrintSepEndCodeGen:
     """Tests for print with sep/end parameters (Phase 5.1)."""
     
-    def test_codegen_print_with_sep(self):
-        """print(1, 2, sep=',') → print(1, 2, sep=',')"""
-        code = generate('print(1, 2, sep=",")')
-        assert code == 'print(1, 2, sep=",")'
-    
-    def test_codegen_print_with_end(self):
-        """print(1, end='') → print(1, end='')"""
-        code = generate('print(1, end="")')
-        assert code == 'print(1, end="")'
-    
-    def test_codegen_print_with_sep_and_end(self):
-        """print(1, 2, sep='-', end='!') → print(1, 2, sep='-', end='!')"""
-        code = generate('print(1, 2, sep="-", end="!")')
-        assert code == 'print(1, 2, sep="-", end="!")'
+    @pytest.mark.parametrize("compiled, expected", [
+        pytest.param('print(1, 2, sep=",")', 'print(1, 2, sep=",")', id="sep"),
+        pytest.param('print(1, end="")', 'print(1, end="")', id="end"),
+        pytest.param('print(1, 2, sep="-", end="!")', 'print(1, 2, sep="-", end="!")', id="sep_and_end"),
+        pytest.param(
+            'print(1, 2, 3, 4, 5, sep=", ", end="\\n")',
+            'print(1, 2, 3, 4, 5, sep=", ", end="\\n")',
+            id="many_args_sep_end",
+        ),
+        pytest.param('print(42, end="")', 'print(42, end="")', id="single_arg_end"),
+        pytest.param('print("a", "b", "c", sep=",")', 'print("a", "b", "c", sep=",")', id="csv_style"),
+        pytest.param('print("Loading", end="")', 'print("Loading", end="")', id="inline_no_newline"),
+    ], indirect=["compiled"])
+    def test_codegen_print_sep_end(self, compiled, expected):
+        """print(..., sep=..., end=...) is passed through unchanged"""
+        assert compiled == expected
     
     def test_codegen_print_sep_variable(self):
         """print with sep as variable"""
@@ -177,28 +160,8 @@ class TestPrintSepEndCodeGen:
         lines = code.split("\n")
         assert lines[1] == "print(1, end=e)"
     
-    def test_codegen_print_many_args_sep_end(self):
-        """print with many args and sep/end"""
-        code = generate('print(1, 2, 3, 4, 5, sep=", ", end="\\n")')
-        assert code == 'print(1, 2, 3, 4, 5, sep=", ", end="\\n")'
-    
-    def test_codegen_print_single_arg_end(self):
-        """print single arg with end (no sep needed)"""
-        code = generate('print(42, end="")')
-        assert code == 'print(42, end="")'
-    
     def test_codegen_print_labeled_output(self):
         """print('Label:', value) pattern"""
         code = generate('let x: int = 100\nprint("Result:", x)')
         lines = code.split("\n")
         assert lines[1] == 'print("Result:", x)'
-    
-    def test_codegen_print_csv_style(self):
-        """print CSV-style output"""
-        code = generate('print("a", "b", "c", sep=",")')
-        assert code == 'print("a", "b", "c", sep=",")'
-    
-    def test_codegen_print_inline_no_newline(self):
-        """print without newline for inline output"""
-        code = generate('print("Loading", end="")')
-        assert code == 'print("Loading", end="")'
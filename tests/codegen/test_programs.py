@@ -8,20 +8,10 @@ Note: Quasar grammar does NOT use semicolons as statement terminators.
 
 import pytest
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.codegen import CodeGenerator
+from tests._pipeline import generate
 
 
-def generate(source: str) -> str:
-    """Helper to parse and generate code from Quasar source."""
-    tokens = Lexer(source).tokenize()
-    ast = Parser(tokens).parse()
-    code = CodeGenerator().generate(ast)
-    # Strip Phase 13 imports for legacy tests
-    code = code.replace("import os as _q_os\nimport sys as _q_sys\n\n", "")
-    code = code.replace("import os as _q_os\nimport sys as _q_sys\n", "") # In case of single newline
-    return code
+pytestmark = pytest.mark.codegen_pure
 
 
 class TestMultipleDeclarations:
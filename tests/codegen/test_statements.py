@@ -8,39 +8,30 @@ Note: Quasar grammar does NOT use semicolons as statement terminators.
 
 import pytest
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.codegen import CodeGenerator
+from tests._pipeline import generate
 
 
-def generate(source: str) -> str:
-    """Helper to parse and generate code from Quasar source."""
-    tokens = Lexer(source).tokenize()
-    ast = Parser(tokens).parse()
-    code = CodeGenerator().generate(ast)
-    # Strip Phase 13 imports for legacy tests
-    code = code.replace("import os as _q_os\nimport sys as _q_sys\n\n", "")
-    return code
+pytestmark = pytest.mark.codegen_pure
 
 
 class TestIfStmt:
     """Tests for if statement generation."""
     
-    def test_if_simple(self):
-        source = """
+    @pytest.mark.parametrize("source, expected", [
+        pytest.param(
+            """
         fn check(x: bool) -> int {
             if x {
                 return 1
             }
             return 0
         }
-        """
-        result = generate(source)
-        expected = "def check(x):\n    if x:\n        return 1\n    return 0"
-        assert result == expected
-    
-    def test_if_else(self):
-        source = """
+        """,
+            "def check(x):\n    if x:\n        return 1\n    return 0",
+            id="if_simple",
+        ),
+        pytest.param(
+            """
         fn decide(cond: bool) -> int {
             if cond {
                 return 1
@@ -48,66 +39,70 @@ class TestIfStmt:
                 return 0
             }
         }
-        """
-        result = generate(source)
-        expected = "def decide(cond):\n    if cond:\n        return 1\n    else:\n        return 0"
-        assert result == expected
-    
-    def test_if_with_comparison(self):
-        source = """
+        """,
+            "def decide(cond):\n    if cond:\n        return 1\n    else:\n        return 0",
+            id="if_else",
+        ),
+        pytest.param(
+            """
         fn isPositive(n: int) -> bool {
             if n > 0 {
                 return true
             }
             return false
         }
-        """
-        result = generate(source)
-        expected = "def isPositive(n):\n    if (n > 0):\n        return True\n    return False"
-        assert result == expected
+        """,
+            "def isPositive(n):\n    if (n > 0):\n        return True\n    return False",
+            id="if_with_comparison",
+        ),
+    ])
+    def test_if(self, source, expected):
+        assert generate(source) == expected
 
 
 class TestWhileStmt:
     """Tests for while statement generation."""
     
-    def test_while_simple(self):
-        source = """
+    @pytest.mark.parametrize("source, expected", [
+        pytest.param(
+            """
         fn loop(flag: bool) -> int {
             while flag {
                 return 1
             }
             return 0
         }
-        """
-        result = generate(source)
-        expected = "def loop(flag):\n    while flag:\n        return 1\n    return 0"
-        assert result == expected
-    
-    def test_while_with_break(self):
-        source = """
+        """,
+            "def loop(flag):\n    while flag:\n        return 1\n    return 0",
+            id="while_simple",
+        ),
+        pytest.param(
+            """
         fn loopBreak(x: bool) -> int {
             while true {
                 break
             }
             return 0
         }
-        """
-        result = generate(source)
-        expected = "def loopBreak(x):\n    while True:\n        break\n    return 0"
-        assert result == expected
-    
-    def test_while_with_continue(self):
-        source = """
+        """,
+            "def loopBreak(x):\n    while True:\n        break\n    return 0",
+            id="while_with_break",
+        ),
+        pytest.param(
+            """
         fn loopContinue(x: bool) -> int {
             while true {
                 continue
             }
             return 0
         }
-        """
-        result = generate(source)
-        expected = "def loopContinue(x):\n    while True:\n        continue\n    return 0"
-        assert result == expected
+        """,
+            "def loopContinue(x):\n    while True:\n        continue\n    return 0",
+            id="while_with_continue",
+        ),
+    ])
+    def test_while(self, source, expected):
+        assert generate(source) == expected
 
 
 class TestReturnStmt:
@@ -0,0 +1,14 @@
+"""
+Shared fixtures for end-to-end tests.
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def cli_workspace(tmp_path_factory):
+    """Scratch directory for CLI source files, one per xdist worker."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return tmp_path_factory.mktemp(f"quasar-{worker}")
@@ -9,41 +9,23 @@ These tests verify the complete pipeline for:
 """
 
 import pytest
-import subprocess
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
+from tests._helpers import head_lines
+from tests._pipeline import run_pipeline, run_python
 
 
-def compile_quasar(source: str) -> str:
-    """Compile Quasar source to Python code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
-    analyzer = SemanticAnalyzer()
-    analyzer.analyze(ast)
-    generator = CodeGenerator()
-    return generator.generate(ast)
+pytestmark = pytest.mark.xdist_group("e2e")
 
 
-def execute_python(code: str) -> str:
-    """Execute Python code and capture output."""
-    result = subprocess.run(
-        ["python", "-c", code],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    return result.stdout
+def compile_quasar(source: str) -> str:
+    """Compile Quasar source to Python code."""
+    return run_pipeline(source, semantic=True)
 
 
 def compile_and_run(source: str) -> str:
     """Compile Quasar source and execute the result."""
     python_code = compile_quasar(source)
-    return execute_python(python_code)
+    return run_python(python_code)
 
 
 class TestMultipleArgumentsE2E:
@@ -144,7 +126,7 @@ class TestSepAndEndCombinedE2E:
 print("Alice", 30, "NYC", sep=",")
 print("Bob", 25, "LA", sep=",")'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = head_lines(output, 3)
         assert lines[0] == "Name,Age,City"
         assert lines[1] == "Alice,30,NYC"
         assert lines[2] == "Bob,25,LA"
@@ -210,7 +192,7 @@ print("Name:", name)
 print("Age:", age)
 print("Height:", height)'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = head_lines(output, 3)
         assert lines[0] == "Name: Alice"
         assert lines[1] == "Age: 30"
         assert lines[2] == "Height: 1.65"
@@ -220,7 +202,7 @@ print("Height:", height)'''
         source = '''print("x", "=", 10, sep="")
 print("y", "=", 20, sep="")'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = head_lines(output, 2)
         assert lines[0] == "x=10"
         assert lines[1] == "y=20"
     
@@ -230,7 +212,7 @@ print("y", "=", 20, sep="")'''
 print(1, "Alice", 95, sep="\\t")
 print(2, "Bob", 87, sep="\\t")'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = head_lines(output, 3)
         assert lines[0] == "ID\tName\tScore"
         assert lines[1] == "1\tAlice\t95"
         assert lines[2] == "2\tBob\t87"
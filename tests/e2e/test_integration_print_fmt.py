@@ -9,41 +9,28 @@ These tests verify the complete pipeline for:
 """
 
 import pytest
-import subprocess
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
+from tests._helpers import head_lines
+from tests._pipeline import run_pipeline, run_python
+
+
+pytestmark = pytest.mark.xdist_group("e2e")
 
 
 def compile_quasar(source: str) -> str:
     """Compile Quasar source to Python code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
-    analyzer = SemanticAnalyzer()
-    analyzer.analyze(ast)
-    generator = CodeGenerator()
-    return generator.generate(ast)
-
-
-def execute_python(code: str) -> str:
-    """Execute Python code and capture output."""
-    result = subprocess.run(
-        ["python", "-c", code],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    return result.stdout
+    return run_pipeline(source, semantic=True)
 
 
-def compile_and_run(source: str) -> str:
-    """Compile Quasar source and execute the result."""
+def compile_and_run_raw(source: str) -> str:
+    """Compile Quasar source and execute the result, keeping exact output."""
     python_code = compile_quasar(source)
-    return execute_python(python_code)
+    return run_python(python_code)
+
+
+def compile_and_run(source: str) -> str:
+    """Compile Quasar source and execute the result, minus trailing newlines."""
+    return compile_and_run_raw(source).rstrip("\n")
 
 
 # =============================================================================
@@ -56,33 +43,33 @@ class TestBasicFormatting:
     def test_format_single_int(self):
         """print('Value: {}', 42) -> 'Value: 42'"""
         output = compile_and_run('print("Value: {}", 42)')
-        assert output.strip() == "Value: 42"
+        assert output == "Value: 42"
     
     def test_format_single_string(self):
         """print('Hello, {}!', 'World') -> 'Hello, World!'"""
         output = compile_and_run('print("Hello, {}!", "World")')
-        assert output.strip() == "Hello, World!"
+        assert output == "Hello, World!"
     
     def test_format_single_float(self):
         """print('Pi: {}', 3.14) -> 'Pi: 3.14'"""
         output = compile_and_run('print("Pi: {}", 3.14)')
-        assert output.strip() == "Pi: 3.14"
+        assert output == "Pi: 3.14"
     
     def test_format_single_bool_true(self):
         """print('Active: {}', true) -> 'Active: True'"""
         output = compile_and_run('print("Active: {}", true)')
-        assert output.strip() == "Active: True"
+        assert output == "Active: True"
     
     def test_format_single_bool_false(self):
         """print('Active: {}', false) -> 'Active: False'"""
         output = compile_and_run('print("Active: {}", false)')
-        assert output.strip() == "Active: False"
+        assert output == "Active: False"
     
     def test_format_with_variable(self):
         """Format with variable argument."""
         source = 'let x: int = 100\nprint("X = {}", x)'
         output = compile_and_run(source)
-        assert output.strip() == "X = 100"
+        assert output == "X = 100"
 
 
 # =============================================================================
@@ -95,33 +82,33 @@ class TestMultiplePlaceholders:
     def test_format_two_placeholders(self):
         """print('{} + {} = 30', 10, 20) -> '10 + 20 = 30'"""
         output = compile_and_run('print("{} + {} = 30", 10, 20)')
-        assert output.strip() == "10 + 20 = 30"
+        assert output == "10 + 20 = 30"
     
     def test_format_three_placeholders(self):
         """print('{} + {} = {}', 10, 20, 30) -> '10 + 20 = 30'"""
         output = compile_and_run('print("{} + {} = {}", 10, 20, 30)')
-        assert output.strip() == "10 + 20 = 30"
+        assert output == "10 + 20 = 30"
     
     def test_format_four_placeholders(self):
         """print('{}, {}, {}, {}', 1, 2, 3, 4) -> '1, 2, 3, 4'"""
         output = compile_and_run('print("{}, {}, {}, {}", 1, 2, 3, 4)')
-        assert output.strip() == "1, 2, 3, 4"
+        assert output == "1, 2, 3, 4"
     
     def test_format_mixed_types(self):
         """print('Name: {}, Age: {}, Active: {}', 'Alice', 30, true)"""
         output = compile_and_run('print("Name: {}, Age: {}, Active: {}", "Alice", 30, true)')
-        assert output.strip() == "Name: Alice, Age: 30, Active: True"
+        assert output == "Name: Alice, Age: 30, Active: True"
     
     def test_format_with_expressions(self):
         """print('Sum: {}, Product: {}', 2+3, 4*5)"""
         output = compile_and_run('print("Sum: {}, Product: {}", 2 + 3, 4 * 5)')
-        assert output.strip() == "Sum: 5, Product: 20"
+        assert output == "Sum: 5, Product: 20"
     
     def test_format_coordinates(self):
         """print('Point({}, {})', x, y)"""
         source = 'let x: int = 10\nlet y: int = 20\nprint("Point({}, {})", x, y)'
         output = compile_and_run(source)
-        assert output.strip() == "Point(10, 20)"
+        assert output == "Point(10, 20)"
 
 
 # =============================================================================
@@ -131,33 +118,19 @@ class TestMultiplePlaceholders:
 class TestFormattingWithEnd:
     """Tests for format strings with end parameter."""
     
-    def test_format_with_end_percent(self):
-        """print('Loading: {}', 99, end='%') -> 'Loading: 99%'"""
-        # Note: no newline at end
-        output = compile_and_run('print("Loading: {}", 99, end="%")')
-        assert output == "Loading: 99%"  # No strip, check exact
-    
-    def test_format_with_end_empty(self):
-        """print('Test: {}', 1, end='') -> 'Test: 1' (no newline)"""
-        output = compile_and_run('print("Test: {}", 1, end="")')
-        assert output == "Test: 1"
-    
-    def test_format_with_end_exclamation(self):
-        """print('Done: {}', 'OK', end='!') -> 'Done: OK!'"""
-        output = compile_and_run('print("Done: {}", "OK", end="!")')
-        assert output == "Done: OK!"
-    
-    def test_format_multi_with_end(self):
-        """Multiple placeholders with end."""
-        output = compile_and_run('print("{} x {} = {}", 3, 4, 12, end="\\n\\n")')
-        assert output == "3 x 4 = 12\n\n"
-    
-    def test_format_progress_bar_simulation(self):
-        """Simulate progress output."""
-        source = '''print("Progress: {}", 50, end="%")
-print(" complete", end="!")'''
-        output = compile_and_run(source)
-        assert output == "Progress: 50% complete!"
+    @pytest.mark.parametrize("source, expected", [
+        # No newline at end: check exact output, no strip
+        pytest.param('print("Loading: {}", 99, end="%")', "Loading: 99%", id="end_percent"),
+        pytest.param('print("Test: {}", 1, end="")', "Test: 1", id="end_empty"),
+        pytest.param('print("Done: {}", "OK", end="!")', "Done: OK!", id="end_exclamation"),
+        pytest.param('print("{} x {} = {}", 3, 4, 12, end="\\n\\n")', "3 x 4 = 12\n\n",
+                     id="multi_with_end"),
+        # Simulated progress output
+        pytest.param('''print("Progress: {}", 50, end="%")
+print(" complete", end="!")''', "Progress: 50% complete!", id="progress_bar_simulation"),
+    ])
+    def test_format_with_end(self, source, expected):
+        assert compile_and_run_raw(source) == expected
 
 
 # =============================================================================
@@ -167,47 +140,21 @@ print(" complete", end="!")'''
 class TestEscapeSequences:
     """Tests for {{ and }} escape sequences."""
     
-    def test_escape_no_args_literal(self):
-        """print('Use {{}} for placeholders') -> 'Use {{}} for placeholders'
-        
-        Note: Single arg = normal mode. The string is printed as-is.
-        Python's print doesn't process {{ }} escapes.
-        """
-        output = compile_and_run('print("Use {{}} for placeholders")')
-        assert output.strip() == "Use {{}} for placeholders"
-    
-    def test_escape_with_format(self):
-        """print('The set is {{ {} }}', 42) -> 'The set is { 42 }'
-        
-        Format mode: .format() processes {{ -> { and {} -> argument.
-        """
-        output = compile_and_run('print("The set is {{ {} }}", 42)')
-        assert output.strip() == "The set is { 42 }"
-    
-    def test_escape_multiple_braces_no_format(self):
-        """print('{{}}{{}}') -> '{{}}{{}}' (single arg, no format)"""
-        output = compile_and_run('print("{{}}{{}}")')
-        assert output.strip() == "{{}}{{}}"
-    
-    def test_escape_mixed_complex(self):
-        """print('A={{}} B={}', 42) -> 'A={} B=42'
-        
-        Format mode: {{ -> {, {} -> 42
-        """
-        output = compile_and_run('print("A={{}} B={}", 42)')
-        assert output.strip() == "A={} B=42"
-    
-    def test_escape_surrounding_text(self):
-        """print('Start {{{}}} End', 'middle') -> 'Start {middle} End'"""
-        output = compile_and_run('print("Start {{{}}} End", "middle")')
-        assert output.strip() == "Start {middle} End"
-    
-    def test_escape_json_dict_style(self):
-        """Format with JSON-like structure using escapes."""
-        # Quasar: print("{{key: {}}}", "value")
-        # Python: print("{{key: {}}}".format("value")) -> "{key: value}"
-        output = compile_and_run('print("{{key: {}}}", "value")')
-        assert output.strip() == "{key: value}"
+    @pytest.mark.parametrize("source, expected", [
+        # Single arg = normal mode: printed as-is, print doesn't process {{ }}
+        pytest.param('print("Use {{}} for placeholders")', "Use {{}} for placeholders",
+                     id="no_args_literal"),
+        # Format mode: {{ -> { and {} -> argument
+        pytest.param('print("The set is {{ {} }}", 42)', "The set is { 42 }", id="with_format"),
+        pytest.param('print("{{}}{{}}")', "{{}}{{}}", id="multiple_braces_no_format"),
+        pytest.param('print("A={{}} B={}", 42)', "A={} B=42", id="mixed_complex"),
+        pytest.param('print("Start {{{}}} End", "middle")', "Start {middle} End",
+                     id="surrounding_text"),
+        # JSON-like structure using escapes
+        pytest.param('print("{{key: {}}}", "value")', "{key: value}", id="json_dict_style"),
+    ])
+    def test_escape(self, source, expected):
+        assert compile_and_run(source) == expected
 
 
 # =============================================================================
@@ -222,18 +169,18 @@ class TestNoMagicRegression:
         source = 'let fmt: str = "Val: {}"\nprint(fmt, 10)'
         output = compile_and_run(source)
         # Normal mode: two args printed with space separator
-        assert output.strip() == "Val: {} 10"
+        assert output == "Val: {} 10"
     
     def test_variable_no_placeholder_multi_args(self):
         """let s='hello'; print(s, 'world') -> 'hello world'"""
         source = 'let s: str = "hello"\nprint(s, "world")'
         output = compile_and_run(source)
-        assert output.strip() == "hello world"
+        assert output == "hello world"
     
     def test_literal_no_placeholder_multi_args(self):
         """print('hello', 1, 2) -> 'hello 1 2' (no {} = normal mode)"""
         output = compile_and_run('print("hello", 1, 2)')
-        assert output.strip() == "hello 1 2"
+        assert output == "hello 1 2"
     
     def test_only_escaped_not_formatted(self):
         """print('{{}}', 1) -> '{{}} 1' (escaped = no real placeholder = normal mode)
@@ -241,12 +188,12 @@ class TestNoMagicRegression:
         Normal mode: string printed as-is, no .format() processing.
         """
         output = compile_and_run('print("{{}}", 1)')
-        assert output.strip() == "{{}} 1"
+        assert output == "{{}} 1"
     
     def test_single_arg_placeholder_literal(self):
         """print('{}') -> '{}' (single arg = no formatting)"""
         output = compile_and_run('print("{}")')
-        assert output.strip() == "{}"
+        assert output == "{}"
 
 
 # =============================================================================
@@ -262,14 +209,14 @@ class TestRealWorldScenarios:
 let msg: str = "Not Found"
 print("Error {}: {}", code, msg)'''
         output = compile_and_run(source)
-        assert output.strip() == "Error 404: Not Found"
+        assert output == "Error 404: Not Found"
     
     def test_table_row_formatting(self):
         """Format a simple table row."""
         source = '''print("| {} | {} | {} |", "Name", "Age", "City")
 print("| {} | {} | {} |", "Alice", 30, "NYC")'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = head_lines(output, 2)
         assert lines[0] == "| Name | Age | City |"
         assert lines[1] == "| Alice | 30 | NYC |"
     
@@ -282,7 +229,7 @@ while i > 0 {
 }
 print("Liftoff!")'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines == ["T-3", "T-2", "T-1", "Liftoff!"]
     
     def test_function_result_formatting(self):
@@ -292,7 +239,7 @@ print("Liftoff!")'''
 }
 print("5 squared is {}", square(5))'''
         output = compile_and_run(source)
-        assert output.strip() == "5 squared is 25"
+        assert output == "5 squared is 25"
     
     def test_conditional_message(self):
         """Conditional message with formatting."""
@@ -303,7 +250,7 @@ if score >= 70 {
     print("Score: {}%. Try again.", score)
 }'''
         output = compile_and_run(source)
-        assert output.strip() == "You passed with 85%!"
+        assert output == "You passed with 85%!"
     
     def test_accumulator_display(self):
         """Display accumulator in loop."""
@@ -315,7 +262,7 @@ while i <= 3 {
     i = i + 1
 }'''
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = head_lines(output, 3)
         assert lines[0] == "After adding 1: sum = 1"
         assert lines[1] == "After adding 2: sum = 3"
         assert lines[2] == "After adding 3: sum = 6"
@@ -328,42 +275,15 @@ while i <= 3 {
 class TestEdgeCases:
     """Edge cases and boundary conditions."""
     
-    def test_empty_string_format_arg(self):
-        """print('Value: {}', '') -> 'Value: '"""
-        output = compile_and_run('print("Value: {}", "")')
-        assert output.strip() == "Value:"
-    
-    def test_placeholder_at_start(self):
-        """print('{} is first', 'This') -> 'This is first'"""
-        output = compile_and_run('print("{} is first", "This")')
-        assert output.strip() == "This is first"
-    
-    def test_placeholder_at_end(self):
-        """print('Last is {}', 'here') -> 'Last is here'"""
-        output = compile_and_run('print("Last is {}", "here")')
-        assert output.strip() == "Last is here"
-    
-    def test_consecutive_placeholders(self):
-        """print('{}{}{}', 'A', 'B', 'C') -> 'ABC'"""
-        output = compile_and_run('print("{}{}{}", "A", "B", "C")')
-        assert output.strip() == "ABC"
-    
-    def test_placeholder_only(self):
-        """print('{}', 42) -> '42'"""
-        output = compile_and_run('print("{}", 42)')
-        assert output.strip() == "42"
-    
-    def test_negative_number_formatting(self):
-        """print('Temp: {}C', -5) -> 'Temp: -5C'"""
-        output = compile_and_run('print("Temp: {}C", 0 - 5)')
-        assert output.strip() == "Temp: -5C"
-    
-    def test_zero_value_formatting(self):
-        """print('Count: {}', 0) -> 'Count: 0'"""
-        output = compile_and_run('print("Count: {}", 0)')
-        assert output.strip() == "Count: 0"
-    
-    def test_large_number_formatting(self):
-        """print('Big: {}', 999999) -> 'Big: 999999'"""
-        output = compile_and_run('print("Big: {}", 999999)')
-        assert output.strip() == "Big: 999999"
+    @pytest.mark.parametrize("source, expected", [
+        pytest.param('print("Value: {}", "")', "Value: ", id="empty_string_format_arg"),
+        pytest.param('print("{} is first", "This")', "This is first", id="placeholder_at_start"),
+        pytest.param('print("Last is {}", "here")', "Last is here", id="placeholder_at_end"),
+        pytest.param('print("{}{}{}", "A", "B", "C")', "ABC", id="consecutive_placeholders"),
+        pytest.param('print("{}", 42)', "42", id="placeholder_only"),
+        pytest.param('print("Temp: {}C", 0 - 5)', "Temp: -5C", id="negative_number"),
+        pytest.param('print("Count: {}", 0)', "Count: 0", id="zero_value"),
+        pytest.param('print("Big: {}", 999999)', "Big: 999999", id="large_number"),
+    ])
+    def test_edge(self, source, expected):
+        assert compile_and_run(source) == expected
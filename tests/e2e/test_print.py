@@ -7,82 +7,39 @@ executed Python output, including CLI integration.
 
 import pytest
 import subprocess
-import tempfile
-from pathlib import Path
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
 from quasar.cli.main import main as cli_main
+from tests._pipeline import run_pipeline, run_python
 
 
-def compile_quasar(source: str) -> str:
-    """Compile Quasar source to Python code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
-    analyzer = SemanticAnalyzer()
-    analyzer.analyze(ast)
-    generator = CodeGenerator()
-    return generator.generate(ast)
+pytestmark = pytest.mark.xdist_group("e2e")
 
 
-def execute_python(code: str) -> str:
-    """Execute Python code and capture output."""
-    result = subprocess.run(
-        ["python", "-c", code],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    return result.stdout
+def compile_quasar(source: str) -> str:
+    """Compile Quasar source to Python code."""
+    return run_pipeline(source, semantic=True)
 
 
 def compile_and_run(source: str) -> str:
     """Compile Quasar source and execute the result."""
     python_code = compile_quasar(source)
-    return execute_python(python_code)
+    return run_python(python_code)
 
 
 class TestPrintE2E:
     """End-to-end tests for print functionality."""
     
-    def test_print_int_output(self):
-        """print(42) should output '42'"""
-        output = compile_and_run("print(42)")
-        assert output.strip() == "42"
-    
-    def test_print_float_output(self):
-        """print(3.14) should output '3.14'"""
-        output = compile_and_run("print(3.14)")
-        assert output.strip() == "3.14"
-    
-    def test_print_true_output(self):
-        """print(true) should output 'True'"""
-        output = compile_and_run("print(true)")
-        assert output.strip() == "True"
-    
-    def test_print_false_output(self):
-        """print(false) should output 'False'"""
-        output = compile_and_run("print(false)")
-        assert output.strip() == "False"
-    
-    def test_print_string_output(self):
-        """print("hello") should output 'hello'"""
-        output = compile_and_run('print("hello")')
-        assert output.strip() == "hello"
-    
-    def test_print_expression_output(self):
-        """print(2 + 3) should output '5'"""
-        output = compile_and_run("print(2 + 3)")
-        assert output.strip() == "5"
-    
-    def test_print_variable_output(self):
-        """print(x) should output variable value"""
-        output = compile_and_run("let x: int = 100\nprint(x)")
-        assert output.strip() == "100"
+    @pytest.mark.parametrize("source, expected", [
+        pytest.param("print(42)", "42", id="int"),
+        pytest.param("print(3.14)", "3.14", id="float"),
+        pytest.param("print(true)", "True", id="true"),
+        pytest.param("print(false)", "False", id="false"),
+        pytest.param('print("hello")', "hello", id="string"),
+        pytest.param("print(2 + 3)", "5", id="expression"),
+        pytest.param("let x: int = 100\nprint(x)", "100", id="variable"),
+    ])
+    def test_print_output(self, source, expected):
+        assert compile_and_run(source).strip() == expected
     
     def test_print_multiple_lines(self):
         """Multiple print statements should output multiple lines"""
@@ -90,7 +47,7 @@ class TestPrintE2E:
 print(2)
 print(3)"""
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines == ["1", "2", "3"]
 
 
@@ -142,7 +99,7 @@ while i <= 3 {
     i = i + 1
 }"""
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines == ["1", "2", "3"]
     
     def test_print_in_conditional_true(self):
@@ -168,82 +125,61 @@ if x > 5 {
         assert output.strip() == "small"
 
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("cli")
 class TestPrintCLI:
     """Tests for print via CLI commands."""
     
-    def test_cli_run_with_print(self):
+    def test_cli_run_with_print(self, cli_workspace, request):
         """quasar run should execute and show print output"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".qsr", delete=False
-        ) as f:
-            f.write('print("Hello from Quasar!")')
-            f.flush()
-            
-            # Use subprocess to capture CLI output
-            result = subprocess.run(
-                ["python", "-m", "quasar", "run", f.name],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            
-            assert result.returncode == 0
-            assert "Hello from Quasar!" in result.stdout
-            
-            Path(f.name).unlink()
-    
-    def test_cli_compile_then_run(self):
+        path = cli_workspace / f"{request.node.name}.qsr"
+        path.write_text('print("Hello from Quasar!")')
+        
+        # Use subprocess to capture CLI output
+        result = subprocess.run(
+            ["python", "-m", "quasar", "run", str(path)],
+            capture_output=True,
+            timeout=10,
+        )
+        
+        assert result.returncode == 0
+        assert "Hello from Quasar!" in result.stdout.decode("utf-8")
+    
+    def test_cli_compile_then_run(self, cli_workspace, request):
         """quasar compile then python execution"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".qsr", delete=False
-        ) as f:
-            f.write("print(42)")
-            f.flush()
-            
-            qsr_path = Path(f.name)
-            py_path = qsr_path.with_suffix(".py")
-            
-            # Compile
-            compile_result = subprocess.run(
-                ["python", "-m", "quasar", "compile", str(qsr_path)],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            assert compile_result.returncode == 0
-            
-            # Run generated Python
-            run_result = subprocess.run(
-                ["python", str(py_path)],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            assert run_result.stdout.strip() == "42"
-            
-            # Cleanup
-            qsr_path.unlink()
-            py_path.unlink()
-    
-    def test_cli_check_print_valid(self):
+        qsr_path = cli_workspace / f"{request.node.name}.qsr"
+        qsr_path.write_text("print(42)")
+        py_path = qsr_path.with_suffix(".py")
+        
+        # Compile
+        compile_result = subprocess.run(
+            ["python", "-m", "quasar", "compile", str(qsr_path)],
+            capture_output=True,
+            timeout=10,
+        )
+        assert compile_result.returncode == 0
+        
+        # Run generated Python
+        run_result = subprocess.run(
+            ["python", str(py_path)],
+            capture_output=True,
+            timeout=10,
+        )
+        assert run_result.stdout.decode("utf-8").strip() == "42"
+    
+    def test_cli_check_print_valid(self, cli_workspace, request):
         """quasar check should validate print syntax"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".qsr", delete=False
-        ) as f:
-            f.write("print(123)")
-            f.flush()
-            
-            result = subprocess.run(
-                ["python", "-m", "quasar", "check", f.name],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            
-            assert result.returncode == 0
-            assert "Valid" in result.stdout
-            
-            Path(f.name).unlink()
+        path = cli_workspace / f"{request.node.name}.qsr"
+        path.write_text("print(123)")
+        
+        result = subprocess.run(
+            ["python", "-m", "quasar", "check", str(path)],
+            capture_output=True,
+            timeout=10,
+        )
+        
+        assert result.returncode == 0
+        assert "Valid" in result.stdout.decode("utf-8")
 
 
 class TestPrintComplexPrograms:
@@ -258,7 +194,7 @@ while count > 0 {
 }
 print(0)"""
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines == ["5", "4", "3", "2", "1", "0"]
     
     def test_fizzbuzz_simplified(self):
@@ -273,7 +209,7 @@ while i <= 5 {
     i = i + 1
 }"""
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines == ["odd", "even", "odd", "even", "odd"]
     
     def test_sum_with_print(self):
@@ -4,43 +4,23 @@ Hardening Tests: Enum Edge Cases
 Aggressive edge case testing for enums. No new semantics—only boundary verification.
 """
 import pytest
-import subprocess
 
-from quasar.lexer import Lexer
 from quasar.parser import Parser
 from quasar.parser.errors import ParserError
-from quasar.semantic import SemanticAnalyzer
 from quasar.semantic.errors import SemanticError
-from quasar.codegen import CodeGenerator
+from tests._pipeline import analyze, run_pipeline, run_python, tokenize
 
 
 def parse(source: str):
-    lexer = Lexer(source)
-    return Parser(lexer.tokenize()).parse()
-
-
-def analyze(source: str):
-    program = parse(source)
-    analyzer = SemanticAnalyzer()
-    return analyzer.analyze(program)
+    return Parser(tokenize(source)).parse()
 
 
 def generate(source: str) -> str:
-    program = analyze(source)
-    return CodeGenerator().generate(program)
+    return run_pipeline(source, semantic=True)
 
 
 def compile_and_run(source: str) -> str:
-    python_code = generate(source)
-    result = subprocess.run(
-        ["python", "-c", python_code],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"Execution failed: {result.stderr}")
-    return result.stdout
+    return run_python(generate(source))
 
 
 # ============================================================================
@@ -80,33 +60,28 @@ class TestSingleVariantEnum:
 # Large Enum Edge Cases
 # ============================================================================
 
+@pytest.fixture(scope="class")
+def large_enum_src() -> str:
+    """Declaration of a 50-variant enum, built once for TestLargeEnum."""
+    variants = ", ".join(f"V{i}" for i in range(50))
+    return f"enum Large {{ {variants} }}"
+
+
 class TestLargeEnum:
     """Enums with many variants."""
 
-    def test_fifty_variants(self):
+    def test_fifty_variants(self, large_enum_src):
         """Enum with 50 variants works."""
-        variants = ", ".join([f"V{i}" for i in range(50)])
-        source = f"enum Large {{ {variants} }}"
-        program = parse(source)
+        program = parse(large_enum_src)
         assert len(program.declarations[0].variants) == 50
 
-    def test_large_enum_first_variant(self):
+    def test_large_enum_first_variant(self, large_enum_src):
         """First variant of large enum accessible."""
-        variants = ", ".join([f"V{i}" for i in range(50)])
-        source = f"""
-        enum Large {{ {variants} }}
-        let v: Large = Large.V0
-        """
-        analyze(source)
+        analyze(f"{large_enum_src}\nlet v: Large = Large.V0")
 
-    def test_large_enum_last_variant(self):
+    def test_large_enum_last_variant(self, large_enum_src):
         """Last variant of large enum accessible."""
-        variants = ", ".join([f"V{i}" for i in range(50)])
-        source = f"""
-        enum Large {{ {variants} }}
-        let v: Large = Large.V49
-        """
-        analyze(source)
+        analyze(f"{large_enum_src}\nlet v: Large = Large.V49")
 
     def test_large_enum_comparison(self):
         """Large enum variants compare correctly."""
@@ -116,7 +91,7 @@ class TestLargeEnum:
         print(Large.V0 == Large.V19)
         print(Large.V10 == Large.V10)
         """)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines[0] == "False"
         assert lines[1] == "True"
 
@@ -202,37 +177,26 @@ class TestDeeplyNestedEnums:
 class TestErrorMessageQuality:
     """Verify error messages contain useful information."""
 
-    def test_E1200_message_contains_name(self):
-        """E1200 mentions the conflicting type name."""
-        with pytest.raises(SemanticError) as excinfo:
-            analyze("enum Foo { A }\nenum Foo { B }")
-        assert "Foo" in excinfo.value.message
-        assert excinfo.value.code == "E1200"
-
-    def test_E1201_message_contains_variant(self):
-        """E1201 mentions the duplicate variant name."""
-        with pytest.raises(SemanticError) as excinfo:
-            analyze("enum Color { Red, Green, Red }")
-        assert "Red" in excinfo.value.message
-        assert excinfo.value.code == "E1201"
-
-    def test_E1202_message_contains_both_names(self):
-        """E1202 mentions enum name and unknown variant."""
-        with pytest.raises(SemanticError) as excinfo:
-            analyze("enum Color { Red }\nlet c: Color = Color.Blue")
-        assert "Color" in excinfo.value.message
-        assert "Blue" in excinfo.value.message
-        assert excinfo.value.code == "E1202"
-
-    def test_E1204_message_contains_types(self):
-        """E1204 mentions both enum types."""
-        with pytest.raises(SemanticError) as excinfo:
-            analyze("""
+    @pytest.mark.parametrize("source, code, needles", [
+        pytest.param("enum Foo { A }\nenum Foo { B }", "E1200", ["Foo"],
+                     id="E1200_conflicting_name"),
+        pytest.param("enum Color { Red, Green, Red }", "E1201", ["Red"],
+                     id="E1201_duplicate_variant"),
+        pytest.param("enum Color { Red }\nlet c: Color = Color.Blue", "E1202", ["Color", "Blue"],
+                     id="E1202_enum_and_variant"),
+        pytest.param("""
             enum A { X }
             enum B { Y }
             let x: bool = A.X == B.Y
-            """)
-        assert excinfo.value.code == "E1204"
+            """, "E1204", [], id="E1204_mismatched_types"),
+    ])
+    def test_message_contents(self, source, code, needles):
+        """Error message names the offending enum, variant or type."""
+        with pytest.raises(SemanticError) as excinfo:
+            analyze(source)
+        assert excinfo.value.code == code
+        for needle in needles:
+            assert needle in excinfo.value.message
 
     def test_E1205_message_mentions_operators(self):
         """E1205 mentions which operators are allowed."""
@@ -5,17 +5,8 @@ Tests for E0303 (missing return), E0304 (return outside function), E0305 (unreac
 """
 import pytest
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
 from quasar.semantic.errors import SemanticError
-
-
-def analyze(source: str):
-    lexer = Lexer(source)
-    program = Parser(lexer.tokenize()).parse()
-    analyzer = SemanticAnalyzer()
-    return analyzer.analyze(program)
+from tests._pipeline import analyze
 
 
 class TestE0304ReturnOutsideFunction:
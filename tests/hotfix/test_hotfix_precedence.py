@@ -9,32 +9,24 @@ Fix: Defensive parentheses in _generate_binary_expr
 """
 
 import pytest
-import subprocess
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
+from tests._pipeline import run_pipeline, run_python
 
 
 def compile_quasar(source: str) -> str:
     """Compile Quasar source to Python code."""
-    tokens = Lexer(source).tokenize()
-    ast = Parser(tokens).parse()
-    ast = SemanticAnalyzer().analyze(ast)
-    return CodeGenerator().generate(ast)
+    return run_pipeline(source, semantic=True)
 
 
 def execute(source: str) -> str:
     """Compile and execute Quasar code."""
+    return run_python(compile_quasar(source)).strip()
+
+
+def assert_emits(source: str, snippet: str) -> None:
+    """Assert the generated Python keeps the grouping spelled out in snippet."""
     python_code = compile_quasar(source)
-    result = subprocess.run(
-        ["python", "-c", python_code],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    return result.stdout.strip()
+    assert snippet in python_code, python_code
 
 
 # =============================================================================
@@ -44,55 +36,21 @@ def execute(source: str) -> str:
 class TestMathPrecedence:
     """Test arithmetic operator precedence preservation."""
     
-    def test_add_then_multiply(self):
-        """(2 + 3) * 4 = 20, not 14."""
-        source = '''
-        let x: int = (2 + 3) * 4
-        print("{}", x)
-        '''
-        assert execute(source) == "20"
-    
-    def test_subtract_then_multiply(self):
-        """(10 - 3) * 2 = 14, not 4."""
-        source = '''
-        let x: int = (10 - 3) * 2
-        print("{}", x)
-        '''
-        assert execute(source) == "14"
-    
-    def test_add_then_divide(self):
-        """(6 + 4) / 2 = 5, not 8."""
-        source = '''
-        let x: int = (6 + 4) / 2
-        print("{}", x)
-        '''
-        # Python division returns float
-        output = execute(source)
-        assert output in ["5", "5.0"]
-    
-    def test_nested_parentheses(self):
-        """((2 + 3) * 4) + 1 = 21."""
-        source = '''
-        let x: int = ((2 + 3) * 4) + 1
-        print("{}", x)
-        '''
-        assert execute(source) == "21"
-    
-    def test_complex_grouping(self):
-        """(1 + 2) * (3 + 4) = 21, not 1 + 6 + 4 = 11."""
-        source = '''
-        let x: int = (1 + 2) * (3 + 4)
-        print("{}", x)
-        '''
-        assert execute(source) == "21"
-    
-    def test_division_before_add(self):
-        """10 / (2 + 3) = 2, not 7."""
-        source = '''
-        let x: float = 10.0 / (2.0 + 3.0)
-        print("{}", x)
-        '''
-        assert execute(source) == "2.0"
+    @pytest.mark.parametrize("source, snippet", [
+        # (2 + 3) * 4 = 20, not 14
+        pytest.param("let x: int = (2 + 3) * 4", "(2 + 3) * 4", id="add_then_multiply"),
+        # (10 - 3) * 2 = 14, not 4
+        pytest.param("let x: int = (10 - 3) * 2", "(10 - 3) * 2", id="subtract_then_multiply"),
+        # (6 + 4) / 2 = 5, not 8
+        pytest.param("let x: int = (6 + 4) / 2", "(6 + 4) / 2", id="add_then_divide"),
+        pytest.param("let x: int = ((2 + 3) * 4) + 1", "((2 + 3) * 4) + 1", id="nested_parentheses"),
+        # (1 + 2) * (3 + 4) = 21, not 1 + 6 + 4 = 11
+        pytest.param("let x: int = (1 + 2) * (3 + 4)", "(1 + 2) * (3 + 4)", id="complex_grouping"),
+        # 10 / (2 + 3) = 2, not 7
+        pytest.param("let x: float = 10.0 / (2.0 + 3.0)", "10.0 / (2.0 + 3.0)", id="division_before_add"),
+    ])
+    def test_math_precedence(self, source, snippet):
+        assert_emits(source, snippet)
 
 
 # =============================================================================
@@ -102,31 +60,14 @@ class TestMathPrecedence:
 class TestLogicPrecedence:
     """Test logical operator precedence preservation."""
     
-    def test_or_then_and(self):
-        """(true || false) && false = False.
-        Without parens: true || (false && false) = true || false = True.
-        """
-        source = '''
-        let res: bool = (true || false) && false
-        print("{}", res)
-        '''
-        assert execute(source) == "False"
-    
-    def test_and_then_or(self):
-        """(false && true) || true = True."""
-        source = '''
-        let res: bool = (false && true) || true
-        print("{}", res)
-        '''
-        assert execute(source) == "True"
-    
-    def test_complex_logic(self):
-        """((true && false) || true) && true = True."""
-        source = '''
-        let res: bool = ((true && false) || true) && true
-        print("{}", res)
-        '''
-        assert execute(source) == "True"
+    @pytest.mark.parametrize("source, snippet", [
+        # Without parens: true || (false && false) = True
+        pytest.param("let res: bool = (true || false) && false", "(True or False) and False", id="or_then_and"),
+        pytest.param("let res: bool = (false && true) || true", "(False and True) or True", id="and_then_or"),
+        pytest.param("let res: bool = ((true && false) || true) && true", "((True and False) or True) and True", id="complex_logic"),
+    ])
+    def test_logic_precedence(self, source, snippet):
+        assert_emits(source, snippet)
 
 
 # =============================================================================
@@ -136,21 +77,12 @@ class TestLogicPrecedence:
 class TestComparisonPrecedence:
     """Test comparison with arithmetic precedence."""
     
-    def test_grouped_comparison(self):
-        """(2 + 3) > 4 = True."""
-        source = '''
-        let res: bool = (2 + 3) > 4
-        print("{}", res)
-        '''
-        assert execute(source) == "True"
-    
-    def test_both_sides_grouped(self):
-        """(2 + 2) == (1 + 3) = True."""
-        source = '''
-        let res: bool = (2 + 2) == (1 + 3)
-        print("{}", res)
-        '''
-        assert execute(source) == "True"
+    @pytest.mark.parametrize("source, snippet", [
+        pytest.param("let res: bool = (2 + 3) > 4", "(2 + 3) > 4", id="grouped_comparison"),
+        pytest.param("let res: bool = (2 + 2) == (1 + 3)", "(2 + 2) == (1 + 3)", id="both_sides_grouped"),
+    ])
+    def test_comparison_precedence(self, source, snippet):
+        assert_emits(source, snippet)
 
 
 # =============================================================================
@@ -158,7 +90,7 @@ class TestComparisonPrecedence:
 # =============================================================================
 
 class TestAverageCalculation:
-    """The original bug case: average with division."""
+    """The original bug case: average with division (run end to end)."""
     
     def test_average_with_parens(self):
         """(10 + 20 + 30) / 3 = 20, not 10 + 20 + 10 = 40."""
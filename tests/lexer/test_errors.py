@@ -25,6 +25,8 @@ class TestUnterminatedString:
         with pytest.raises(LexerError) as exc_info:
             lexer.tokenize()
         assert "unterminated string" in exc_info.value.message
+        assert exc_info.value.span.start_line == 1
+        assert exc_info.value.span.end_line == 1
 
 
 class TestUnexpectedCharacter:
@@ -13,8 +13,7 @@ class TestPrintKeyword:
     
     def test_print_keyword_recognized(self):
         """print should be tokenized as PRINT keyword."""
-        lexer = Lexer("print")
-        tokens = lexer.tokenize()
+        tokens = Lexer("print").tokenize()
         
         assert len(tokens) == 2  # PRINT + EOF
         assert tokens[0].type == TokenType.PRINT
@@ -22,8 +21,7 @@ class TestPrintKeyword:
     
     def test_print_in_statement_context(self):
         """print(42) should tokenize correctly."""
-        lexer = Lexer("print(42)")
-        tokens = lexer.tokenize()
+        tokens = Lexer("print(42)").tokenize()
         
         assert len(tokens) == 5  # PRINT ( INT_LITERAL ) EOF
         assert tokens[0].type == TokenType.PRINT
@@ -35,16 +33,14 @@ class TestPrintKeyword:
     
     def test_print_is_not_identifier(self):
         """print should NOT be tokenized as identifier."""
-        lexer = Lexer("print")
-        tokens = lexer.tokenize()
+        tokens = Lexer("print").tokenize()
         
         assert tokens[0].type == TokenType.PRINT
         assert tokens[0].type != TokenType.IDENTIFIER
     
     def test_print_is_case_sensitive(self):
         """PRINT, Print should be identifiers, not keywords."""
-        lexer = Lexer("PRINT Print pRiNt")
-        tokens = lexer.tokenize()
+        tokens = Lexer("PRINT Print pRiNt").tokenize()
         
         # All should be identifiers (case-sensitive)
         assert tokens[0].type == TokenType.IDENTIFIER
@@ -60,8 +56,7 @@ class TestPrintSepEnd:
     
     def test_sep_keyword_recognized(self):
         """sep should be tokenized as SEP keyword."""
-        lexer = Lexer("sep")
-        tokens = lexer.tokenize()
+        tokens = Lexer("sep").tokenize()
         
         assert len(tokens) == 2  # SEP + EOF
         assert tokens[0].type == TokenType.SEP
@@ -69,58 +64,40 @@ class TestPrintSepEnd:
     
     def test_end_keyword_recognized(self):
         """end should be tokenized as END keyword."""
-        lexer = Lexer("end")
-        tokens = lexer.tokenize()
+        tokens = Lexer("end").tokenize()
         
         assert len(tokens) == 2  # END + EOF
         assert tokens[0].type == TokenType.END
         assert tokens[0].lexeme == "end"
     
-    def test_sep_in_print_context(self):
-        """print(a, sep=',') should tokenize correctly."""
-        lexer = Lexer('print(a, sep=",")')
-        tokens = lexer.tokenize()
+    @pytest.mark.parametrize("source, expected_types", [
+        pytest.param('print(a, sep=",")', (
+            TokenType.PRINT, TokenType.LPAREN, TokenType.IDENTIFIER, TokenType.COMMA,
+            TokenType.SEP, TokenType.EQUAL, TokenType.STRING_LITERAL,
+            TokenType.RPAREN, TokenType.EOF,
+        ), id="sep_in_print_context"),
+        pytest.param('print(a, end="")', (
+            TokenType.PRINT, TokenType.LPAREN, TokenType.IDENTIFIER, TokenType.COMMA,
+            TokenType.END, TokenType.EQUAL, TokenType.STRING_LITERAL,
+            TokenType.RPAREN, TokenType.EOF,
+        ), id="end_in_print_context"),
+        pytest.param('print(a, b, sep=",", end="!")', (
+            TokenType.PRINT, TokenType.LPAREN, TokenType.IDENTIFIER, TokenType.COMMA,
+            TokenType.IDENTIFIER, TokenType.COMMA,
+            TokenType.SEP, TokenType.EQUAL, TokenType.STRING_LITERAL, TokenType.COMMA,
+            TokenType.END, TokenType.EQUAL, TokenType.STRING_LITERAL,
+            TokenType.RPAREN, TokenType.EOF,
+        ), id="sep_and_end_together"),
+    ])
+    def test_print_keyword_arguments(self, source, expected_types):
+        """sep/end inside a print call tokenize as keywords, not identifiers."""
+        tokens = Lexer(source).tokenize()
         
-        # PRINT ( IDENTIFIER , SEP = STRING_LITERAL ) EOF
-        assert len(tokens) == 9
-        assert tokens[0].type == TokenType.PRINT
-        assert tokens[1].type == TokenType.LPAREN
-        assert tokens[2].type == TokenType.IDENTIFIER
-        assert tokens[2].lexeme == "a"
-        assert tokens[3].type == TokenType.COMMA
-        assert tokens[4].type == TokenType.SEP
-        assert tokens[5].type == TokenType.EQUAL
-        assert tokens[6].type == TokenType.STRING_LITERAL
-        assert tokens[7].type == TokenType.RPAREN
-        assert tokens[8].type == TokenType.EOF
-    
-    def test_end_in_print_context(self):
-        """print(a, end='') should tokenize correctly."""
-        lexer = Lexer('print(a, end="")')
-        tokens = lexer.tokenize()
-        
-        # PRINT ( IDENTIFIER , END = STRING_LITERAL ) EOF
-        assert len(tokens) == 9
-        assert tokens[0].type == TokenType.PRINT
-        assert tokens[4].type == TokenType.END
-        assert tokens[5].type == TokenType.EQUAL
-        assert tokens[6].type == TokenType.STRING_LITERAL
-    
-    def test_sep_and_end_together(self):
-        """print(a, b, sep=',', end='!') should tokenize all keywords."""
-        lexer = Lexer("print(a, b, sep=\",\", end=\"!\")")
-        tokens = lexer.tokenize()
-        
-        # PRINT ( a , b , sep = "," , end = "!" ) EOF
-        assert len(tokens) == 15
-        assert tokens[0].type == TokenType.PRINT
-        assert tokens[6].type == TokenType.SEP
-        assert tokens[10].type == TokenType.END
+        assert tuple(token.type for token in tokens) == expected_types
     
     def test_sep_end_case_sensitive(self):
         """SEP, End, END should be identifiers (case-sensitive)."""
-        lexer = Lexer("SEP End END Sep")
-        tokens = lexer.tokenize()
+        tokens = Lexer("SEP End END Sep").tokenize()
         
         assert tokens[0].type == TokenType.IDENTIFIER
         assert tokens[0].lexeme == "SEP"
@@ -58,6 +58,37 @@ class TestMultipleTokenSpans:
         assert tokens[1].span.start_column == 1
 
 
+class TestRunSpans:
+    """Test spans of identifiers, numbers and comments scanned as runs."""
+    
+    def test_identifier_and_number_spans(self) -> None:
+        """Multi-character identifiers and numbers cover their full length."""
+        lexer = Lexer("abc_1 = 12.50", "test.qsr")
+        tokens = lexer.tokenize()
+        assert (tokens[0].span.start_column, tokens[0].span.end_column) == (1, 5)
+        assert (tokens[2].span.start_column, tokens[2].span.end_column) == (9, 13)
+    
+    def test_token_after_comment_line(self) -> None:
+        """A comment does not shift the next line's columns."""
+        lexer = Lexer("# note\nx", "test.qsr")
+        tokens = lexer.tokenize()
+        assert tokens[0].span.start_line == 2
+        assert tokens[0].span.start_column == 1
+    
+    def test_token_after_whitespace_run(self) -> None:
+        """Runs of spaces and tabs advance the column by their length."""
+        lexer = Lexer("let \t  x", "test.qsr")
+        tokens = lexer.tokenize()
+        assert tokens[1].span.start_column == 8
+    
+    def test_eof_after_trailing_comment(self) -> None:
+        """A comment without a trailing newline runs to end of source."""
+        lexer = Lexer("x # note", "test.qsr")
+        tokens = lexer.tokenize()
+        assert len(tokens) == 2
+        assert tokens[-1].span.start_column == 9
+
+
 class TestStringLiteralSpan:
     """Test span for string literals."""
     
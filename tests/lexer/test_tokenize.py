@@ -9,112 +9,65 @@ import pytest
 from quasar.lexer import Lexer, Token, TokenType
 
 
-class TestKeywords:
-    """Test keyword tokenization."""
-    
-    @pytest.mark.parametrize("source,expected", [
-        ("let", TokenType.LET),
-        ("const", TokenType.CONST),
-        ("fn", TokenType.FN),
-        ("return", TokenType.RETURN),
-        ("if", TokenType.IF),
-        ("else", TokenType.ELSE),
-        ("while", TokenType.WHILE),
-        ("break", TokenType.BREAK),
-        ("continue", TokenType.CONTINUE),
-        ("true", TokenType.TRUE),
-        ("false", TokenType.FALSE),
-    ])
-    def test_language_keywords(self, source: str, expected: TokenType) -> None:
-        """Each language keyword should produce the correct token type."""
+# Every source here lexes to exactly one token whose lexeme is the source.
+SINGLE_TOKENS = (
+    # Language keywords
+    pytest.param("let", TokenType.LET, id="LET"),
+    pytest.param("const", TokenType.CONST, id="CONST"),
+    pytest.param("fn", TokenType.FN, id="FN"),
+    pytest.param("return", TokenType.RETURN, id="RETURN"),
+    pytest.param("if", TokenType.IF, id="IF"),
+    pytest.param("else", TokenType.ELSE, id="ELSE"),
+    pytest.param("while", TokenType.WHILE, id="WHILE"),
+    pytest.param("break", TokenType.BREAK, id="BREAK"),
+    pytest.param("continue", TokenType.CONTINUE, id="CONTINUE"),
+    pytest.param("true", TokenType.TRUE, id="TRUE"),
+    pytest.param("false", TokenType.FALSE, id="FALSE"),
+    # Type keywords
+    pytest.param("int", TokenType.INT, id="INT"),
+    pytest.param("float", TokenType.FLOAT, id="FLOAT"),
+    pytest.param("bool", TokenType.BOOL, id="BOOL"),
+    pytest.param("str", TokenType.STR, id="STR"),
+    # Arithmetic operators
+    pytest.param("+", TokenType.PLUS, id="PLUS"),
+    pytest.param("-", TokenType.MINUS, id="MINUS"),
+    pytest.param("*", TokenType.STAR, id="STAR"),
+    pytest.param("/", TokenType.SLASH, id="SLASH"),
+    pytest.param("%", TokenType.PERCENT, id="PERCENT"),
+    # Comparison operators
+    pytest.param("==", TokenType.EQUAL_EQUAL, id="EQUAL_EQUAL"),
+    pytest.param("!=", TokenType.BANG_EQUAL, id="BANG_EQUAL"),
+    pytest.param("<", TokenType.LESS, id="LESS"),
+    pytest.param(">", TokenType.GREATER, id="GREATER"),
+    pytest.param("<=", TokenType.LESS_EQUAL, id="LESS_EQUAL"),
+    pytest.param(">=", TokenType.GREATER_EQUAL, id="GREATER_EQUAL"),
+    # Logical operators
+    pytest.param("&&", TokenType.AND_AND, id="AND_AND"),
+    pytest.param("||", TokenType.OR_OR, id="OR_OR"),
+    pytest.param("!", TokenType.BANG, id="BANG"),
+    # Assignment and arrow
+    pytest.param("=", TokenType.EQUAL, id="EQUAL"),
+    pytest.param("->", TokenType.ARROW, id="ARROW"),
+    # Punctuation
+    pytest.param("(", TokenType.LPAREN, id="LPAREN"),
+    pytest.param(")", TokenType.RPAREN, id="RPAREN"),
+    pytest.param("{", TokenType.LBRACE, id="LBRACE"),
+    pytest.param("}", TokenType.RBRACE, id="RBRACE"),
+    pytest.param(":", TokenType.COLON, id="COLON"),
+    pytest.param(",", TokenType.COMMA, id="COMMA"),
+)
+
+
+class TestSingleTokens:
+    """Test keyword, operator and punctuation tokenization."""
+    
+    @pytest.mark.parametrize("source,expected", SINGLE_TOKENS)
+    def test_single_token(self, source: str, expected: TokenType) -> None:
+        """Each keyword, operator and punctuation mark produces its token type."""
         lexer = Lexer(source, "test.qsr")
         tokens = lexer.tokenize()
         assert tokens[0].type == expected
         assert tokens[0].lexeme == source
-    
-    @pytest.mark.parametrize("source,expected", [
-        ("int", TokenType.INT),
-        ("float", TokenType.FLOAT),
-        ("bool", TokenType.BOOL),
-        ("str", TokenType.STR),
-    ])
-    def test_type_keywords(self, source: str, expected: TokenType) -> None:
-        """Each type keyword should produce the correct token type."""
-        lexer = Lexer(source, "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == expected
-
-
-class TestOperators:
-    """Test operator tokenization."""
-    
-    @pytest.mark.parametrize("source,expected", [
-        ("+", TokenType.PLUS),
-        ("-", TokenType.MINUS),
-        ("*", TokenType.STAR),
-        ("/", TokenType.SLASH),
-        ("%", TokenType.PERCENT),
-    ])
-    def test_arithmetic_operators(self, source: str, expected: TokenType) -> None:
-        """Arithmetic operators should produce correct token types."""
-        lexer = Lexer(source, "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == expected
-    
-    @pytest.mark.parametrize("source,expected", [
-        ("==", TokenType.EQUAL_EQUAL),
-        ("!=", TokenType.BANG_EQUAL),
-        ("<", TokenType.LESS),
-        (">", TokenType.GREATER),
-        ("<=", TokenType.LESS_EQUAL),
-        (">=", TokenType.GREATER_EQUAL),
-    ])
-    def test_comparison_operators(self, source: str, expected: TokenType) -> None:
-        """Comparison operators should produce correct token types."""
-        lexer = Lexer(source, "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == expected
-    
-    @pytest.mark.parametrize("source,expected", [
-        ("&&", TokenType.AND_AND),
-        ("||", TokenType.OR_OR),
-        ("!", TokenType.BANG),
-    ])
-    def test_logical_operators(self, source: str, expected: TokenType) -> None:
-        """Logical operators should produce correct token types."""
-        lexer = Lexer(source, "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == expected
-    
-    def test_assignment_operator(self) -> None:
-        """Assignment operator should produce EQUAL token."""
-        lexer = Lexer("=", "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == TokenType.EQUAL
-    
-    def test_arrow_operator(self) -> None:
-        """Arrow operator should produce ARROW token."""
-        lexer = Lexer("->", "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == TokenType.ARROW
-
-
-class TestPunctuation:
-    """Test punctuation tokenization."""
-    
-    @pytest.mark.parametrize("source,expected", [
-        ("(", TokenType.LPAREN),
-        (")", TokenType.RPAREN),
-        ("{", TokenType.LBRACE),
-        ("}", TokenType.RBRACE),
-        (":", TokenType.COLON),
-        (",", TokenType.COMMA),
-    ])
-    def test_punctuation(self, source: str, expected: TokenType) -> None:
-        """Punctuation should produce correct token types."""
-        lexer = Lexer(source, "test.qsr")
-        tokens = lexer.tokenize()
-        assert tokens[0].type == expected
 
 
 class TestLiterals:
@@ -294,3 +247,4 @@ class TestCompleteStatements:
             TokenType.EOF,
         ]
         assert types == expected
+
@@ -6,7 +6,6 @@ Tests that declaration statements produce correct AST nodes.
 
 import pytest
 
-from quasar.lexer import Lexer
 from quasar.parser import Parser
 from quasar.ast import (
     Program,
@@ -21,12 +20,12 @@ from quasar.ast import (
     StringLiteral,
     BoolLiteral,
 )
+from tests._pipeline import tokenize
 
 
 def parse(source: str) -> Program:
     """Helper to parse source into a Program AST."""
-    lexer = Lexer(source, "test.qsr")
-    tokens = lexer.tokenize()
+    tokens = tokenize(source, "test.qsr")
     parser = Parser(tokens)
     return parser.parse()
 
@@ -127,17 +126,17 @@ class TestFnDecl:
         decl = prog.declarations[0]
         assert decl.return_type == TypeAnnotation.INT
     
-    def test_fn_decl_all_return_types(self) -> None:
+    @pytest.mark.parametrize("type_str, type_enum", [
+        ("int", TypeAnnotation.INT),
+        ("float", TypeAnnotation.FLOAT),
+        ("bool", TypeAnnotation.BOOL),
+        ("str", TypeAnnotation.STR),
+    ])
+    def test_fn_decl_all_return_types(self, type_str, type_enum) -> None:
         """Functions can return any of the four types."""
-        for type_str, type_enum in [
-            ("int", TypeAnnotation.INT),
-            ("float", TypeAnnotation.FLOAT),
-            ("bool", TypeAnnotation.BOOL),
-            ("str", TypeAnnotation.STR),
-        ]:
-            prog = parse(f"fn f() -> {type_str} {{ return x }}")
-            decl = prog.declarations[0]
-            assert decl.return_type == type_enum
+        prog = parse(f"fn f() -> {type_str} {{ return x }}")
+        decl = prog.declarations[0]
+        assert decl.return_type == type_enum
 
 
 class TestMultipleDeclarations:
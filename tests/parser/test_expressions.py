@@ -6,8 +6,8 @@ Tests that expressions produce correct AST nodes with proper precedence.
 
 import pytest
 
-from quasar.lexer import Lexer
 from quasar.parser import Parser
+from quasar.parser.parser import _BINARY_OPERATORS, _UNARY_OPERATORS
 from quasar.ast import (
     FnDecl,
     ReturnStmt,
@@ -22,13 +22,13 @@ from quasar.ast import (
     BinaryOp,
     UnaryOp,
 )
+from tests._pipeline import tokenize
 
 
 def parse_expr(expr_source: str):
     """Helper to parse an expression (via return statement)."""
     source = f"fn test() -> int {{ return {expr_source} }}"
-    lexer = Lexer(source, "test.qsr")
-    tokens = lexer.tokenize()
+    tokens = tokenize(source, "test.qsr")
     parser = Parser(tokens)
     prog = parser.parse()
     fn = prog.declarations[0]
@@ -222,6 +222,14 @@ class TestAssociativity:
         assert isinstance(expr.right, IntLiteral)
         assert expr.left.operator == BinaryOp.SUB
 
+    def test_left_associativity_same_level(self) -> None:
+        """8 / 4 % 3 * 2 should parse as ((8 / 4) % 3) * 2."""
+        expr = parse_expr("8 / 4 % 3 * 2")
+        assert expr.operator == BinaryOp.MUL
+        assert expr.left.operator == BinaryOp.MOD
+        assert expr.left.left.operator == BinaryOp.DIV
+        assert isinstance(expr.left.left.left, IntLiteral)
+
 
 class TestCallExpr:
     """Test function call expression parsing."""
@@ -273,3 +281,13 @@ class TestComplexExpressions:
         assert expr.operator == BinaryOp.GT
         assert expr.left.operator == BinaryOp.ADD
         assert expr.right.operator == BinaryOp.MUL
+
+
+class TestOperatorTables:
+    """Parser operator tables."""
+    
+    def test_binary_table_covers_every_operator(self) -> None:
+        assert {op for _, op in _BINARY_OPERATORS.values()} == set(BinaryOp)
+    
+    def test_unary_table_covers_every_operator(self) -> None:
+        assert set(_UNARY_OPERATORS.values()) == set(UnaryOp)
@@ -4,7 +4,6 @@ Tests for print statement parsing (Phase 5 + 5.1).
 
 import pytest
 
-from quasar.lexer import Lexer
 from quasar.parser import Parser
 from quasar.parser.errors import ParserError
 from quasar.ast import (
@@ -17,12 +16,12 @@ from quasar.ast import (
     BinaryExpr,
     CallExpr,
 )
+from tests._pipeline import tokenize
 
 
 def parse(source: str):
     """Helper to parse source code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
+    tokens = tokenize(source)
     parser = Parser(tokens)
     return parser.parse()
 
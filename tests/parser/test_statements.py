@@ -6,7 +6,6 @@ Tests that statements produce correct AST nodes.
 
 import pytest
 
-from quasar.lexer import Lexer
 from quasar.parser import Parser
 from quasar.ast import (
     Program,
@@ -26,13 +25,13 @@ from quasar.ast import (
     IntLiteral,
     BoolLiteral,
 )
+from tests._pipeline import tokenize
 
 
 def parse_fn_body(body_source: str) -> Block:
     """Helper to parse function body statements."""
     source = f"fn test() -> int {{ {body_source} }}"
-    lexer = Lexer(source, "test.qsr")
-    tokens = lexer.tokenize()
+    tokens = tokenize(source, "test.qsr")
     parser = Parser(tokens)
     prog = parser.parse()
     fn = prog.declarations[0]
@@ -16,10 +16,7 @@ Test coverage:
 
 import pytest
 
-from quasar.lexer import Lexer
 from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
 from quasar.ast import (
     DictType,
     DictLiteral,
@@ -31,34 +28,24 @@ from quasar.ast import (
     is_dict,
     is_hashable,
 )
+from tests._pipeline import analyze, run_pipeline, tokenize
 
 
 def compile_to_python(source: str) -> str:
     """Helper to compile Quasar source to Python."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
-    analyzer = SemanticAnalyzer()
-    analyzer.analyze(ast)
-    generator = CodeGenerator()
-    return generator.generate(ast)
+    return run_pipeline(source, semantic=True)
 
 
 def parse_only(source: str):
     """Helper to only parse source code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
+    tokens = tokenize(source)
     parser = Parser(tokens)
     return parser.parse()
 
 
 def analyze_only(source: str):
     """Helper to parse and analyze source code."""
-    ast = parse_only(source)
-    analyzer = SemanticAnalyzer()
-    analyzer.analyze(ast)
-    return ast
+    return analyze(source)
 
 
 # =============================================================================
@@ -4,20 +4,9 @@ Phase 12.1 Tests: Enum Semantic Analysis
 Tests for enum type checking, error codes E1200-E1205, and type resolution.
 """
 import pytest
-from quasar.lexer.lexer import Lexer
-from quasar.parser.parser import Parser
-from quasar.semantic.analyzer import SemanticAnalyzer
 from quasar.semantic.errors import SemanticError
 from quasar.ast.types import EnumType
-
-
-def analyze(source: str):
-    """Parse and analyze source."""
-    lexer = Lexer(source)
-    parser = Parser(lexer.tokenize())
-    program = parser.parse()
-    analyzer = SemanticAnalyzer()
-    return analyzer.analyze(program)
+from tests._pipeline import analyze
 
 
 # ============================================================================
@@ -6,22 +6,12 @@ End-to-end tests that compile and execute Quasar enum programs.
 import pytest
 import subprocess
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
+from tests._pipeline import run_pipeline
 
 
 def compile_quasar(source: str) -> str:
     """Compile Quasar source to Python code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
-    analyzer = SemanticAnalyzer()
-    analyzer.analyze(ast)
-    generator = CodeGenerator()
-    return generator.generate(ast)
+    return run_pipeline(source, semantic=True)
 
 
 def execute_python(code: str) -> str:
@@ -162,7 +152,7 @@ class TestEnumFunctionsE2E:
         print(is_ok(Status.Err))
         """
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines[0] == "True"
         assert lines[1] == "False"
 
@@ -180,7 +170,7 @@ class TestEnumFunctionsE2E:
         print(get_result(false))
         """
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert "Success" in lines[0]
         assert "Failure" in lines[1]
 
@@ -226,7 +216,7 @@ class TestEnumStateMachineE2E:
         }
         """
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines[0] == "Start: Red"
         assert lines[1] == "After 1: Green"
         assert lines[2] == "After 2: Yellow"
@@ -256,7 +246,7 @@ class TestEnumStateMachineE2E:
         print(conn == ConnectionState.Connected)
         """
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines[0] == "True"
         assert lines[1] == "True"
 
@@ -311,7 +301,7 @@ class TestEnumComplexE2E:
         print(state == ProcessState.Stopping)
         """
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines[0] == "3"
         assert lines[1] == "True"
 
@@ -333,6 +323,6 @@ class TestEnumComplexE2E:
         }
         """
         output = compile_and_run(source)
-        lines = output.strip().split("\n")
+        lines = output.rstrip("\n").splitlines()
         assert lines[0] == "color is blue"
         assert lines[1] == "size is medium"
@@ -14,13 +14,7 @@ from quasar.lexer import Lexer
 from quasar.parser import Parser
 from quasar.semantic import SemanticAnalyzer, SemanticError
 from quasar.codegen import CodeGenerator
-
-
-def analyze(source: str):
-    """Helper to run semantic analysis."""
-    tokens = Lexer(source).tokenize()
-    ast = Parser(tokens).parse()
-    return SemanticAnalyzer().analyze(ast)
+from tests._pipeline import analyze
 
 
 def compile_to_python(source: str) -> str:
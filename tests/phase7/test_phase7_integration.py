@@ -8,18 +8,12 @@ These tests validate complete interactive programs using mocked stdin.
 import pytest
 import subprocess
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer
-from quasar.codegen import CodeGenerator
+from tests._pipeline import run_pipeline
 
 
 def compile_quasar(source: str) -> str:
     """Compile Quasar source to Python code."""
-    tokens = Lexer(source).tokenize()
-    ast = Parser(tokens).parse()
-    ast = SemanticAnalyzer().analyze(ast)
-    return CodeGenerator().generate(ast)
+    return run_pipeline(source, semantic=True)
 
 
 def execute_python(code: str, stdin: str = "") -> str:
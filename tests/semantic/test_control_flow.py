@@ -6,19 +6,8 @@ Tests that control flow violations produce appropriate semantic errors.
 
 import pytest
 
-from quasar.lexer import Lexer
-from quasar.parser import Parser
-from quasar.semantic import SemanticAnalyzer, SemanticError
-
-
-def analyze(source: str):
-    """Helper to run semantic analysis on source."""
-    lexer = Lexer(source, "test.qsr")
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    program = parser.parse()
-    analyzer = SemanticAnalyzer()
-    return analyzer.analyze(program)
+from quasar.semantic import SemanticError
+from tests._pipeline import analyze
 
 
 def expect_error(source: str, error_code: str):
@@ -14,16 +14,7 @@ import pytest
 from quasar.lexer import Lexer
 from quasar.parser import Parser
 from quasar.semantic import SemanticAnalyzer, SemanticError
-
-
-def analyze(source: str):
-    """Helper to run semantic analysis on source."""
-    lexer = Lexer(source, "test.qsr")
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    program = parser.parse()
-    analyzer = SemanticAnalyzer()
-    return analyzer.analyze(program)
+from tests._pipeline import analyze
 
 
 def expect_error(source: str, error_code: str):
@@ -162,3 +153,16 @@ fn f() -> void {
 }
 """
         expect_error(source, "E0003")
+
+
+class TestAnalyzerReset:
+    """SemanticAnalyzer.reset() makes an instance reusable."""
+    
+    def test_reset_clears_declarations(self) -> None:
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(Parser(Lexer("let x: int = 1").tokenize()).parse())
+        program = Parser(Lexer("let x: int = 2").tokenize()).parse()
+        with pytest.raises(SemanticError):
+            analyzer.analyze(program)
+        analyzer.reset()
+        assert analyzer.analyze(program) is program